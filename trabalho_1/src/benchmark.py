@@ -0,0 +1,220 @@
+import csv
+import json
+import random
+import statistics
+import sys
+import time
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+from max_clique import graph,random_graph,max_clique
+
+DEFAULT_REPEAT=5
+DEFAULT_WARMUP=1
+DEFAULT_TOLERANCE=0.25
+DEFAULT_MIN_TIME_NS=1000000
+FIELDS=["experiment","engine","n","m","sample","ops","configs","sols","median_ns","q1_ns","q3_ns","iqr_ns","repeat"]
+
+def measure(g: graph,engine: str,repeat: int=DEFAULT_REPEAT,warmup: int=DEFAULT_WARMUP,**options)->dict:
+    """
+    Time max_clique on a graph several times with perf_counter_ns, after some untimed warm-up runs.
+
+    Args:
+        g (graph): Graph to solve.
+        engine (str): max_clique engine to use.
+        repeat (int): Number of timed runs.
+        warmup (int): Number of untimed runs done first.
+
+    Returns:
+        dict: number of basic operations, configurations and solutions, and the median, quartiles and IQR of the times (ns).
+    """
+    assert (repeat>=1 and warmup>=0),"invalid repeat/warmup"
+    for _ in range(warmup):
+        max_clique(g,engine,**options)
+    times=[]
+    for _ in range(repeat):
+        start=time.perf_counter_ns()
+        results=max_clique(g,engine,**options)
+        times.append(time.perf_counter_ns()-start)
+    if repeat>1:
+        q1,median,q3=statistics.quantiles(times,n=4,method="inclusive")
+    else:
+        q1=median=q3=times[0]
+    return {"ops":results[1],"configs":results[2],"sols":len(results[0]),"median_ns":int(median),"q1_ns":int(q1),"q3_ns":int(q3),"iqr_ns":int(q3-q1),"repeat":repeat}
+
+def increasing_n_points(beg: int,end: int)->list:
+    """
+    Graphs used by basic_op_increasing_n and exec_time_increasing_n: beg to end nodes, no edges.
+
+    Returns:
+        list: (experiment, sample, graph) triples.
+    """
+    return [("increasing_n",0,graph(n,[])) for n in range(beg,end+1)]
+
+def sol_config_points(beg: int,end: int,sample_size: int,seed: int=0)->list:
+    """
+    Graphs used by sol_config_ratio_increasing_n: sample_size random graphs with beg nodes, grown up to end nodes.
+    The graphs are seeded, so every run measures the same ones.
+
+    Returns:
+        list: (experiment, sample, graph) triples.
+    """
+    points=[]
+    max_edges=beg*(beg-1)//2
+    for i in range(sample_size):
+        if max_edges>0:
+            g=random_graph(beg,random.Random(seed+i).randrange(max_edges),seed=seed+i)
+        else:
+            g=graph(beg,[])
+        for n in range(beg,end+1):
+            points.append(("sol_config_ratio",i,graph(n,list(g.edges))))
+    return points
+
+def increasing_m_points(n: int,beg: int,end: int,seed: int=0)->list:
+    """
+    Graphs used by increasing_m: n nodes with beg to end random edges, seeded.
+
+    Returns:
+        list: (experiment, sample, graph) triples.
+    """
+    return [("increasing_m",0,random_graph(n,m,seed=seed+m)) for m in range(beg,end+1)]
+
+def run(points: list,engines: list,repeat: int=DEFAULT_REPEAT,warmup: int=DEFAULT_WARMUP)->list:
+    """
+    Measure every engine on every graph.
+
+    Args:
+        points (list): (experiment, sample, graph) triples, as returned by the *_points functions.
+        engines (list): max_clique engines to measure.
+        repeat (int): Number of timed runs per point.
+        warmup (int): Number of untimed runs per point.
+
+    Returns:
+        list: One dictionary per engine and point, with the keys in FIELDS.
+    """
+    results=[]
+    for engine in engines:
+        for experiment,sample,g in points:
+            row={"experiment":experiment,"engine":engine,"n":g.n_vertices,"m":g.n_edges(),"sample":sample}
+            row.update(measure(g,engine,repeat,warmup))
+            results.append(row)
+    return results
+
+def write_json(results: list,path: str)->None:
+    with open(path,"w",encoding="utf-8") as f:
+        json.dump(results,f,indent=1)
+
+def write_csv(results: list,path: str)->None:
+    with open(path,"w",encoding="utf-8",newline="") as f:
+        writer=csv.DictWriter(f,fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+
+def load_results(path: str)->list:
+    """
+    Read results written by write_json or write_csv.
+    """
+    with open(path,"r",encoding="utf-8") as f:
+        if path.endswith(".csv"):
+            return [{k:(v if k in ("experiment","engine") else int(v)) for k,v in row.items()} for row in csv.DictReader(f)]
+        return json.load(f)
+
+def compare(results: list,baseline: list,tolerance: float=DEFAULT_TOLERANCE,min_time_ns: int=DEFAULT_MIN_TIME_NS)->list:
+    """
+    Compare results against a stored baseline.
+    A point regresses if its operation/configuration counts changed, or if its median time grew by more than tolerance.
+    Times of points whose baseline median is under min_time_ns are too noisy to compare and are skipped.
+
+    Args:
+        results (list): Results of run.
+        baseline (list): Results of an earlier run.
+        tolerance (float): Allowed relative slowdown.
+        min_time_ns (int): Smallest baseline median that is compared.
+
+    Returns:
+        list: Description of every regression found, empty if there are none.
+    """
+    key=lambda r:(r["experiment"],r["engine"],r["n"],r["m"],r["sample"])
+    old={key(r):r for r in baseline}
+    regressions=[]
+    for r in results:
+        b=old.get(key(r))
+        if b is None:
+            continue
+        label="%s/%s n=%d m=%d sample=%d" % key(r)
+        if r["ops"]!=b["ops"] or r["configs"]!=b["configs"]:
+            regressions.append(label+": counters changed from %d/%d to %d/%d" % (b["ops"],b["configs"],r["ops"],r["configs"]))
+        if b["median_ns"]>=min_time_ns and r["median_ns"]>b["median_ns"]*(1+tolerance):
+            regressions.append(label+": median time went from %d ns to %d ns" % (b["median_ns"],r["median_ns"]))
+    return regressions
+
+def plot(results: list,path_prefix: str)->None:
+    """
+    Write the basic operations and median time plots of every experiment to png files, one line per engine.
+
+    Args:
+        results (list): Results of run.
+        path_prefix (str): Prefix of the files, followed by the experiment and metric names.
+    """
+    for experiment in sorted({r["experiment"] for r in results}):
+        x_key="m" if experiment=="increasing_m" else "n"
+        for metric,label in (("ops","# basic operations"),("median_ns","time (ns)")):
+            plt.figure()
+            for engine in sorted({r["engine"] for r in results}):
+                points={}
+                for r in results:
+                    if r["experiment"]==experiment and r["engine"]==engine:
+                        points.setdefault(r[x_key],[]).append(r[metric])
+                x=sorted(points)
+                plt.plot(x,[sum(points[k])/len(points[k]) for k in x],label=engine)
+            plt.title(experiment)
+            plt.xlabel(x_key)
+            plt.ylabel(label)
+            plt.legend(loc="upper left")
+            plt.savefig(path_prefix+experiment+"_"+metric+".png")
+            plt.close()
+
+if __name__ == "__main__":
+    args=sys.argv
+    engines=["exhaustive"]
+    beg,end,sample_size,repeat,warmup=1,12,3,DEFAULT_REPEAT,DEFAULT_WARMUP
+    out="benchmark"
+    baseline=None
+    tolerance=DEFAULT_TOLERANCE
+    plot_prefix=None
+    for i in range(2,len(args),2):
+        if args[i-1]=="-engines":
+            engines=args[i].split(",")
+        elif args[i-1]=="-beg":
+            beg=int(args[i])
+        elif args[i-1]=="-end":
+            end=int(args[i])
+        elif args[i-1]=="-samples":
+            sample_size=int(args[i])
+        elif args[i-1]=="-repeat":
+            repeat=int(args[i])
+        elif args[i-1]=="-warmup":
+            warmup=int(args[i])
+        elif args[i-1]=="-out":
+            out=args[i]
+        elif args[i-1]=="-baseline":
+            baseline=args[i]
+        elif args[i-1]=="-tolerance":
+            tolerance=float(args[i])
+        elif args[i-1]=="-plot":
+            plot_prefix=args[i]
+        else:
+            print("Unknown parameter "+args[i-1]+", parameters are -engines a,b -beg n -end n -samples n -repeat n -warmup n -out prefix -baseline file -tolerance x -plot prefix")
+            sys.exit(2)
+    points=increasing_n_points(beg,end)+sol_config_points(beg,end,sample_size)+increasing_m_points(end,1,end*(end-1)//2)
+    results=run(points,engines,repeat,warmup)
+    write_json(results,out+".json")
+    write_csv(results,out+".csv")
+    if plot_prefix is not None:
+        plot(results,plot_prefix)
+    if baseline is not None:
+        regressions=compare(results,load_results(baseline),tolerance)
+        for r in regressions:
+            print(r)
+        if regressions:
+            sys.exit(1)
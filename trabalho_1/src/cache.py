@@ -0,0 +1,120 @@
+import hashlib
+import json
+import sqlite3
+import zlib
+from max_clique import graph,max_clique,graph_digest
+
+DEFAULT_CACHE_PATH="max_clique_cache.sqlite"
+DEFAULT_MAX_BYTES=2**28
+
+def graph_key(g: graph,engine: str,options: dict)->str:
+    """
+    Get the content hash of a solve: sha256 of the graph_digest of the graph and the engine and its options as sorted JSON.
+    The same graph gets the same key however its edges were given, and a graph and its csr_graph form share their keys.
+
+    Args:
+        g (graph): Graph to solve.
+        engine (str): max_clique engine.
+        options (dict): Extra arguments of the engine, must be JSON serialisable.
+
+    Returns:
+        str: Hexadecimal key.
+    """
+    h=hashlib.sha256(graph_digest(g))
+    h.update(json.dumps([engine,options],sort_keys=True).encode())
+    return h.hexdigest()
+
+def cacheable(engine: str,options: dict)->bool:
+    """
+    Check if a solve always gives the same result, so it can be cached: every engine but the "anytime" heuristic is exact,
+    and "anytime" is only repeatable with a seed and no time budget. Solves that don't return a list (mode="count" or "iter") aren't cached.
+    """
+    if options.get("mode","list")!="list":
+        return False
+    if engine=="anytime":
+        return options.get("seed") is not None and options.get("time_budget") is None
+    return True
+
+class clique_cache:
+    """
+    Results of max_clique kept in a SQLite file, keyed by graph_key.
+    Results are stored as compressed JSON, and once the stored results go over max_bytes the least recently used ones are evicted.
+    Cached results keep the executing time of the run that computed them.
+    """
+    def __init__(self,path: str=DEFAULT_CACHE_PATH,max_bytes: int=DEFAULT_MAX_BYTES):
+        assert (max_bytes>=0),"invalid max_bytes"
+        self.max_bytes=max_bytes
+        self.db=sqlite3.connect(path)
+        self.db.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, used INTEGER NOT NULL)")
+        self.db.execute("CREATE INDEX IF NOT EXISTS results_used ON results (used)")
+        self.db.commit()
+        self.clock=self.db.execute("SELECT COALESCE(MAX(used),0) FROM results").fetchone()[0]
+        self.hits=0
+        self.misses=0
+        self.evictions=0
+
+    def __str__(self):
+        return str(len(self)) + " results, " + str(self.n_bytes()) + " bytes: " + str(self.hits) + " hits, " + str(self.misses) + " misses, " + str(self.evictions) + " evictions"
+
+    def __len__(self):
+        return self.db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def n_bytes(self)->int:
+        return self.db.execute("SELECT COALESCE(SUM(size),0) FROM results").fetchone()[0]
+
+    def get(self,key: str):
+        """
+        Get a stored result and mark it as used, None if there is none.
+        """
+        row=self.db.execute("SELECT value FROM results WHERE key=?",(key,)).fetchone()
+        if row is None:
+            self.misses+=1
+            return None
+        self.hits+=1
+        self.clock+=1
+        self.db.execute("UPDATE results SET used=? WHERE key=?",(self.clock,key))
+        self.db.commit()
+        return tuple(json.loads(zlib.decompress(row[0])))
+
+    def put(self,key: str,result: tuple)->None:
+        """
+        Store a result, then evict the least recently used results until the cache fits in max_bytes.
+        """
+        value=zlib.compress(json.dumps(result).encode())
+        self.clock+=1
+        self.db.execute("INSERT OR REPLACE INTO results VALUES (?,?,?,?)",(key,value,len(value),self.clock))
+        total=self.n_bytes()
+        while total>self.max_bytes:
+            key,size=self.db.execute("SELECT key,size FROM results ORDER BY used LIMIT 1").fetchone()
+            self.db.execute("DELETE FROM results WHERE key=?",(key,))
+            total-=size
+            self.evictions+=1
+        self.db.commit()
+
+    def max_clique(self,g: graph,engine: str="exhaustive",**options)->(list,int,int,float):
+        """
+        max_clique, answered from the cache when the same graph was already solved with the same engine and options.
+        Solves whose options can't be stored as JSON (callbacks, counters objects) or that aren't cacheable skip the cache.
+
+        Args:
+            g (graph): Graph to find max clique from
+            engine (str): max_clique engine to use.
+            **options: Extra arguments for max_clique.
+
+        Returns:
+            list,int,int,float: list of solutions, number of occurrences of the innermost operation, number of configurations generated, executing time.
+        """
+        if not cacheable(engine,options):
+            return max_clique(g,engine,**options)
+        try:
+            key=graph_key(g,engine,options)
+        except TypeError:
+            return max_clique(g,engine,**options)
+        result=self.get(key)
+        if result is None:
+            result=max_clique(g,engine,**options)
+            self.put(key,result)
+        return result
+
+    def close(self)->None:
+        self.db.close()
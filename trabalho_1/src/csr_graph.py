@@ -0,0 +1,149 @@
+import numpy as np
+
+CSR_MAGIC=0x47525343
+HEADER_SIZE=3*8
+
+class csr_graph:
+    """
+    Class to represent a large sparse graph in compressed sparse row (CSR) form.
+    The neighbours of vertex v are targets[offsets[v]:offsets[v+1]], sorted, with every edge stored in both directions
+    as int32, so an edge takes 8 bytes. Vertices are numbered from 1, like in graph.
+    Offers the degree, neighbourhood and local_masks queries the clique engines of max_clique.py use,
+    so a csr_graph can be given to them directly (max_clique(csr, "bk")).
+    """
+    __slots__=("n_vertices","offsets","targets")
+
+    def __init__(self,n_vertices: int,offsets: np.ndarray,targets: np.ndarray):
+        assert(n_vertices>=0 and len(offsets)==n_vertices+2 and offsets[-1]==len(targets)),"invalid csr arrays"
+        self.n_vertices=n_vertices
+        self.offsets=offsets
+        self.targets=targets
+
+    @classmethod
+    def from_arrays(cls,n_vertices: int,first: np.ndarray,second: np.ndarray,allow_duplicates: bool=False)->"csr_graph":
+        """
+        Create a graph from two arrays with the ends of its edges.
+
+        Args:
+            n_vertices (int): Number of vertices.
+            first (np.ndarray): First vertex of every edge.
+            second (np.ndarray): Second vertex of every edge.
+            allow_duplicates (bool): Drop repeated edges (in either direction) instead of refusing them.
+
+        Returns:
+            csr_graph: The graph.
+        """
+        assert(n_vertices>=0),"invalid number of vertices"
+        first=np.asarray(first,dtype=np.int64)
+        second=np.asarray(second,dtype=np.int64)
+        assert(first.shape==second.shape and first.ndim==1),"invalid edge arrays"
+        assert(((first>=1)&(first<=n_vertices)&(second>=1)&(second<=n_vertices)).all()),"invalid edge"
+        assert((first!=second).all()),"invalid edge"
+        keys=np.concatenate((first*(n_vertices+1)+second,second*(n_vertices+1)+first))
+        keys.sort()
+        repeated=keys[1:]==keys[:-1]
+        if repeated.any():
+            assert(allow_duplicates),"repeated edge"
+            keys=keys[np.concatenate(([True],~repeated))]
+        rows=keys//(n_vertices+1)
+        offsets=np.zeros(n_vertices+2,dtype=np.int64)
+        np.cumsum(np.bincount(rows,minlength=n_vertices+1),out=offsets[1:])
+        return cls(n_vertices,offsets,(keys%(n_vertices+1)).astype(np.int32))
+
+    @classmethod
+    def from_graph(cls,g)->"csr_graph":
+        """
+        Create the CSR form of a graph.
+        """
+        return cls.from_arrays(g.n_vertices,*g.edge_arrays())
+
+    def save(self,path: str)->None:
+        """
+        Write the graph to a binary file: a header (magic number, number of vertices, number of targets),
+        the offsets as int64 and the targets as int32.
+        """
+        with open(path,"wb") as f:
+            f.write(np.array([CSR_MAGIC,self.n_vertices,len(self.targets)],dtype=np.int64).tobytes())
+            f.write(np.ascontiguousarray(self.offsets,dtype=np.int64).tobytes())
+            f.write(np.ascontiguousarray(self.targets,dtype=np.int32).tobytes())
+
+    @classmethod
+    def load(cls,path: str,mmap: bool=True)->"csr_graph":
+        """
+        Read a graph written by save.
+
+        Args:
+            path (str): Path to the file.
+            mmap (bool): Map the file read-only instead of reading it, so only the parts used are loaded.
+
+        Returns:
+            csr_graph: The graph.
+        """
+        magic,n_vertices,n_targets=np.fromfile(path,dtype=np.int64,count=3).tolist()
+        assert(magic==CSR_MAGIC),"not a csr_graph file"
+        targets_offset=HEADER_SIZE+8*(n_vertices+2)
+        if mmap:
+            offsets=np.memmap(path,dtype=np.int64,mode="r",offset=HEADER_SIZE,shape=(n_vertices+2,))
+            targets=np.memmap(path,dtype=np.int32,mode="r",offset=targets_offset,shape=(n_targets,)) if n_targets else np.empty(0,dtype=np.int32)
+        else:
+            offsets=np.fromfile(path,dtype=np.int64,count=n_vertices+2,offset=HEADER_SIZE)
+            targets=np.fromfile(path,dtype=np.int32,count=n_targets,offset=targets_offset)
+        return cls(n_vertices,offsets,targets)
+
+    def n_edges(self)->int:
+        return len(self.targets)//2
+
+    def nbytes(self)->int:
+        return self.offsets.nbytes+self.targets.nbytes
+
+    def degree(self,v: int)->int:
+        return int(self.offsets[v+1]-self.offsets[v])
+
+    def degrees(self)->np.ndarray:
+        """
+        Get the degree of every vertex (index 0 is unused).
+        """
+        return np.diff(self.offsets)
+
+    def neighbourhood(self,v: int)->np.ndarray:
+        """
+        Get the sorted neighbours of v, as a view of targets.
+        """
+        return self.targets[self.offsets[v]:self.offsets[v+1]]
+
+    def has_edge(self,i: int,j: int)->bool:
+        row=self.neighbourhood(i)
+        k=np.searchsorted(row,j)
+        return bool(k<len(row) and row[k]==j)
+
+    def edge_arrays(self)->(np.ndarray,np.ndarray):
+        """
+        Get the ends of the edges as two arrays, each edge once with first < second.
+        """
+        first=np.repeat(np.arange(self.n_vertices+1,dtype=np.int64),self.degrees())
+        keep=first<self.targets
+        return first[keep],self.targets[keep].astype(np.int64)
+
+    def local_masks(self,vertices: list)->list:
+        """
+        Get the adjacency bitmasks of the subgraph induced by some vertices, numbered by their position in the list.
+
+        Args:
+            vertices (list): Vertices of the subgraph.
+
+        Returns:
+            list: Bitmask of every vertex, bit i set if it is adjacent to vertices[i].
+        """
+        vertices=np.asarray(vertices,dtype=np.int64)
+        order=np.argsort(vertices)
+        ordered=vertices[order]
+        row_bits=np.zeros(len(vertices),dtype=bool)
+        masks=[]
+        for v in vertices.tolist():
+            row=self.neighbourhood(v)
+            k=np.minimum(np.searchsorted(ordered,row),len(ordered)-1)
+            hits=order[k[ordered[k]==row]]
+            row_bits[hits]=True
+            masks.append(int.from_bytes(np.packbits(row_bits,bitorder="little").tobytes(),"little"))
+            row_bits[hits]=False
+        return masks
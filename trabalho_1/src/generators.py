@@ -0,0 +1,109 @@
+import math
+import numpy as np
+
+def pairs_from_indices(n: int,indices: np.ndarray)->(np.ndarray,np.ndarray):
+    """
+    Turn positions in the row-major upper triangle of an n x n adjacency matrix into edges.
+    Position 0 is the edge 1--2, position n-2 is 1--n, position n-1 is 2--3 and so on.
+
+    Args:
+        n (int): Number of vertices.
+        indices (np.ndarray): Positions, between 0 and n(n-1)/2 - 1.
+
+    Returns:
+        np.ndarray,np.ndarray: First and second vertices of the edges (1 based, first < second).
+    """
+    k=np.asarray(indices,dtype=np.int64)
+    b=2*n-1
+    i=np.floor((b-np.sqrt(np.maximum(b*b-8.0*k,0.0)))/2).astype(np.int64)
+    ##fix the rows the floating point square root got wrong
+    offset=i*(b-i)//2
+    i-=(offset>k)
+    offset=i*(b-i)//2
+    next_offset=(i+1)*(b-i-1)//2
+    i+=(next_offset<=k)
+    offset=i*(b-i)//2
+    j=k-offset+i+1
+    return i+1,j+1
+
+def sample_indices(total: int,m: int,rng: np.random.Generator)->np.ndarray:
+    """
+    Pick m distinct positions out of range(total), every set of m positions being equally likely.
+    Positions are drawn with replacement in rounds and the repeats removed, then the surplus is dropped at random.
+    When more than half of the positions are wanted, the ones left out are picked instead.
+
+    Args:
+        total (int): Number of positions to pick from.
+        m (int): Number of positions to pick.
+        rng (np.random.Generator): Generator to draw from.
+
+    Returns:
+        np.ndarray: The positions, sorted.
+    """
+    if 2*m>total:
+        keep=np.ones(total,dtype=bool)
+        keep[sample_indices(total,total-m,rng)]=False
+        return np.flatnonzero(keep)
+    chosen=np.empty(0,dtype=np.int64)
+    while len(chosen)<m:
+        free=total-len(chosen)
+        size=-total*math.log1p(-(m-len(chosen))/free) if m-len(chosen)<free else 2*total
+        draws=rng.integers(0,total,size=int(1.05*size)+16)
+        chosen=np.sort(np.concatenate((chosen,draws)))
+        chosen=chosen[np.concatenate(([True],chosen[1:]!=chosen[:-1]))]
+    if len(chosen)>m:
+        chosen=np.delete(chosen,rng.permutation(len(chosen))[:len(chosen)-m])
+    return chosen
+
+def gnm_edges(n: int,m: int,seed=None)->(np.ndarray,np.ndarray):
+    """
+    Pick m distinct random edges for a graph with n vertices, the G(n,m) model.
+    The positions are sampled without replacement from the n(n-1)/2 possible edges, without checking edges one by one.
+
+    Args:
+        n (int): Number of vertices.
+        m (int): Number of edges.
+        seed: Seed or np.random.Generator to draw from, a fresh generator is used when None.
+
+    Returns:
+        np.ndarray,np.ndarray: First and second vertices of the edges (1 based, first < second).
+    """
+    assert (n>=1),"invalid number of vertices"
+    total=n*(n-1)//2
+    assert (0<=m<=total),"invalid number of edges"
+    rng=np.random.default_rng(seed)
+    return pairs_from_indices(n,sample_indices(total,m,rng))
+
+def gnp_edges(n: int,p: float,seed=None)->(np.ndarray,np.ndarray):
+    """
+    Pick random edges for a graph with n vertices, each edge being there with chance p, the G(n,p) model.
+    Instead of one draw per possible edge, the gaps between chosen edges are drawn from a geometric distribution.
+
+    Args:
+        n (int): Number of vertices.
+        p (float): Chance of each edge.
+        seed: Seed or np.random.Generator to draw from, a fresh generator is used when None.
+
+    Returns:
+        np.ndarray,np.ndarray: First and second vertices of the edges (1 based, first < second).
+    """
+    assert (n>=1),"invalid number of vertices"
+    assert (0<=p<=1),"invalid probability"
+    total=n*(n-1)//2
+    rng=np.random.default_rng(seed)
+    if p==0 or total==0:
+        return pairs_from_indices(n,np.empty(0,dtype=np.int64))
+    if p==1:
+        return pairs_from_indices(n,np.arange(total,dtype=np.int64))
+    expected=total*p
+    batch=int(expected+5*math.sqrt(expected*(1-p)))+1
+    chunks=[]
+    last=-1
+    while True:
+        positions=last+np.cumsum(rng.geometric(p,size=batch))
+        if positions[-1]>=total:
+            chunks.append(positions[positions<total])
+            break
+        chunks.append(positions)
+        last=int(positions[-1])
+    return pairs_from_indices(n,np.concatenate(chunks))
@@ -0,0 +1,120 @@
+import numpy as np
+from max_clique import graph
+
+DEFAULT_CHUNK_SIZE=2**22
+OTHER_MARKS=(b"#",b"%",b"c",b"p")
+
+def _read_numbers(path: str,prefix: bytes,chunk_size: int)->(list,list):
+    """
+    Stream a text file in chunks of about chunk_size bytes and parse the numbers of its data lines,
+    the ones starting with prefix (any line without letters or comment marks when prefix is empty).
+    Chunks without headers or comments are parsed in one go, the others line by line.
+
+    Args:
+        path (str): Path to the file.
+        prefix (bytes): Start of the data lines, dropped before parsing.
+        chunk_size (int): Approximate number of bytes read at once.
+
+    Returns:
+        list,list: Arrays of numbers parsed from every chunk, lines that aren't data (headers and comments).
+    """
+    parts=[]
+    other=[]
+    with open(path,"rb") as f:
+        while True:
+            block=f.read(chunk_size)+f.readline()
+            if not block:
+                break
+            if not any(mark in block for mark in OTHER_MARKS):
+                if prefix:
+                    block=block.replace(prefix,b" ")
+            else:
+                kept=[]
+                for line in block.splitlines():
+                    if prefix and line[:len(prefix)]==prefix:
+                        kept.append(line[len(prefix):])
+                    elif not prefix and not any(mark in line for mark in OTHER_MARKS):
+                        kept.append(line)
+                    elif line.strip():
+                        other.append(line)
+                block=b" ".join(kept)
+            parts.append(np.fromstring(block,dtype=np.int64,sep=" "))
+    return parts,other
+
+def read_dimacs(path: str,allow_duplicates: bool=False,chunk_size: int=DEFAULT_CHUNK_SIZE)->graph:
+    """
+    Load a graph in the DIMACS format (.clq): a "p edge n m" line, "e i j" lines with the edges and "c" comment lines.
+
+    Args:
+        path (str): Path to the file.
+        allow_duplicates (bool): Drop repeated edges instead of refusing the file.
+        chunk_size (int): Approximate number of bytes read at once.
+
+    Returns:
+        graph: The graph in the file.
+    """
+    parts,other=_read_numbers(path,b"e",chunk_size)
+    header=[line.split() for line in other if line[:1]==b"p"]
+    assert(len(header)==1 and len(header[0])==4),"missing or invalid p line"
+    n_vertices=int(header[0][2])
+    edges=np.concatenate(parts) if parts else np.empty(0,dtype=np.int64)
+    assert(len(edges)%2==0),"invalid e line"
+    edges=edges.reshape(-1,2)
+    return graph.from_arrays(n_vertices,edges[:,0],edges[:,1],allow_duplicates)
+
+def read_edge_list(path: str,n_vertices: int=None,zero_based: bool=False,allow_duplicates: bool=False,chunk_size: int=DEFAULT_CHUNK_SIZE)->graph:
+    """
+    Load a graph from a file with one "i j" edge per line. Lines starting with #, % or c are comments.
+
+    Args:
+        path (str): Path to the file.
+        n_vertices (int): Number of vertices, the largest vertex in the file when None.
+        zero_based (bool): Whether vertices in the file are numbered from 0 instead of 1.
+        allow_duplicates (bool): Drop repeated edges instead of refusing the file.
+        chunk_size (int): Approximate number of bytes read at once.
+
+    Returns:
+        graph: The graph in the file.
+    """
+    parts,_=_read_numbers(path,b"",chunk_size)
+    edges=np.concatenate(parts) if parts else np.empty(0,dtype=np.int64)
+    assert(len(edges)%2==0),"invalid edge line"
+    if zero_based:
+        edges=edges+1
+    edges=edges.reshape(-1,2)
+    if n_vertices is None:
+        n_vertices=int(edges.max()) if len(edges) else 0
+    return graph.from_arrays(n_vertices,edges[:,0],edges[:,1],allow_duplicates)
+
+def _write_edges(f,g: graph,fmt: bytes,offset: int,chunk_size: int)->None:
+    first,second=g.edge_arrays()
+    rows=max(1,chunk_size//16)
+    for start in range(0,len(first),rows):
+        block=zip((first[start:start+rows]+offset).tolist(),(second[start:start+rows]+offset).tolist())
+        f.write(b"".join([fmt % pair for pair in block]))
+
+def write_dimacs(g: graph,path: str,chunk_size: int=DEFAULT_CHUNK_SIZE)->None:
+    """
+    Write a graph in the DIMACS format (.clq).
+
+    Args:
+        g (graph): Graph to write.
+        path (str): Path to the file.
+        chunk_size (int): Approximate number of bytes written at once.
+    """
+    with open(path,"wb") as f:
+        f.write(b"p edge %d %d\n" % (g.n_vertices,g.n_edges()))
+        _write_edges(f,g,b"e %d %d\n",0,chunk_size)
+
+def write_edge_list(g: graph,path: str,zero_based: bool=False,chunk_size: int=DEFAULT_CHUNK_SIZE)->None:
+    """
+    Write a graph with one "i j" edge per line.
+
+    Args:
+        g (graph): Graph to write.
+        path (str): Path to the file.
+        zero_based (bool): Number the vertices from 0 instead of 1.
+        chunk_size (int): Approximate number of bytes written at once.
+    """
+    with open(path,"wb") as f:
+        _write_edges(f,g,b"%d %d\n",-1 if zero_based else 0,chunk_size)
@@ -1,79 +1,353 @@
 import math
-from itertools import combinations
+import os
+import json
+import hashlib
+from itertools import combinations,islice,chain
+from concurrent.futures import ProcessPoolExecutor,as_completed
+from collections import OrderedDict
+from array import array
 import time
 import random
+import statistics
+import numpy as np
 import matplotlib.pyplot as plt
+from generators import gnm_edges,gnp_edges,pairs_from_indices
+
+CHUNKS_PER_WORKER=8
+DEFAULT_BATCH_SIZE=2**14
+DEFAULT_REC_CACHE_SIZE=2**20
+DEFAULT_ANYTIME_OPS=10000
+DEFAULT_TABU_TENURE=7
+DEFAULT_GREEDY_STARTS=10
+DEFAULT_MITM_TABLE_BITS=24
+DEFAULT_MITM_CHUNK_BITS=16
+DEFAULT_CONFIDENCE=0.95
+DEFAULT_CHECKPOINT_INTERVAL=60
+CHECKPOINT_BLOCK=2**14
 
 class graph:
     """
     Class to represent a graph.
+    Besides the list of edges, keeps an indexed adjacency form: a set of neighbours and
+    an integer bitmask (bit v set for each neighbour v) for every vertex, so edge lookups are O(1).
+    The bitmasks are built the first time they are used, and kept current from then on.
+    Vertices are numbered from 1, index 0 of the adjacency lists is unused.
     """
     def __init__(self,n_vertices,edges):
         assert(n_vertices>=0),"invalid number of vertices"
         self.n_vertices=n_vertices
         assert (0<=len(edges)<=(n_vertices*(n_vertices-1))/2),"invalid number of edges"
+        self.neighbours=[set() for _ in range(n_vertices+1)]
+        self._adj_masks=None
         for i,j in edges:
             assert(i!=j and 1<=i<=n_vertices and 1<=j<=n_vertices),"invalid edge"
-        self.edges=edges
+            self.__link(i,j)
+        self._edges=list(edges)
+        self._edge_arrays=None
+
+    @classmethod
+    def from_arrays(cls,n_vertices: int,first: np.ndarray,second: np.ndarray,allow_duplicates: bool=False)->"graph":
+        """
+        Create a graph from two arrays with the ends of its edges, without going through a list of tuples.
+        The edges are validated all at once, and the neighbour sets are built from the edges grouped by vertex.
+
+        Args:
+            n_vertices (int): Number of vertices.
+            first (np.ndarray): First vertex of every edge.
+            second (np.ndarray): Second vertex of every edge.
+            allow_duplicates (bool): Drop repeated edges (in either direction) instead of refusing them.
+
+        Returns:
+            graph: The graph.
+        """
+        assert(n_vertices>=0),"invalid number of vertices"
+        first=np.asarray(first,dtype=np.int64)
+        second=np.asarray(second,dtype=np.int64)
+        assert(first.shape==second.shape and first.ndim==1),"invalid edge arrays"
+        assert(((first>=1)&(first<=n_vertices)&(second>=1)&(second<=n_vertices)).all()),"invalid edge"
+        assert((first!=second).all()),"invalid edge"
+        keys=np.minimum(first,second)*(n_vertices+1)+np.maximum(first,second)
+        order=np.argsort(keys)
+        repeated=np.zeros(len(keys),dtype=bool)
+        repeated[order[1:]]=keys[order[1:]]==keys[order[:-1]]
+        if repeated.any():
+            assert(allow_duplicates),"repeated edge"
+            first=first[~repeated]
+            second=second[~repeated]
+        assert (len(first)<=(n_vertices*(n_vertices-1))/2),"invalid number of edges"
+        g=cls.__new__(cls)
+        g.n_vertices=n_vertices
+        ends=np.concatenate((first,second))
+        others=np.concatenate((second,first))
+        sorted_others=others[np.argsort(ends)]
+        bounds=np.cumsum(np.bincount(ends,minlength=n_vertices+1))[:-1]
+        g.neighbours=[set(row.tolist()) for row in np.split(sorted_others,bounds)]
+        g._adj_masks=None
+        g._edges=None
+        g._edge_arrays=(first,second)
+        return g
+
+    @property
+    def edges(self)->list:
+        """
+        List of the edges as (i,j) tuples.
+        """
+        if self._edges is None:
+            self._edges=list(zip(self._edge_arrays[0].tolist(),self._edge_arrays[1].tolist()))
+            self._edge_arrays=None
+        return self._edges
+
+    def edge_arrays(self)->(np.ndarray,np.ndarray):
+        """
+        Get the ends of the edges as two arrays, without building the list of edges.
+        """
+        if self._edges is None:
+            return self._edge_arrays
+        e=np.array(self._edges,dtype=np.int64).reshape(-1,2)
+        return e[:,0],e[:,1]
+
+    def n_edges(self)->int:
+        return len(self._edges) if self._edges is not None else len(self._edge_arrays[0])
+
+    @property
+    def adj_masks(self)->list:
+        """
+        Adjacency bitmask of every vertex, built the first time it's needed.
+        """
+        if self._adj_masks is None:
+            row=np.zeros(self.n_vertices+1,dtype=bool)
+            masks=[]
+            for adjacent in self.neighbours:
+                index=np.fromiter(adjacent,dtype=np.int64,count=len(adjacent))
+                row[index]=True
+                masks.append(int.from_bytes(np.packbits(row,bitorder="little").tobytes(),"little"))
+                row[index]=False
+            self._adj_masks=masks
+        return self._adj_masks
 
     def __str__(self):
-        s= str(self.n_vertices) +" nodes\n"
-        for i,j in self.edges:
-            s+=str(i) + "--" + str(j)+"\n"
-        return s
+        first,second=self.edge_arrays()
+        return str(self.n_vertices) +" nodes\n" + "".join(str(i) + "--" + str(j)+"\n" for i,j in zip(first.tolist(),second.tolist()))
+
+    def __link(self,i,j):
+        self.neighbours[i].add(j)
+        self.neighbours[j].add(i)
+        if self._adj_masks is not None:
+            self._adj_masks[i]|=1<<j
+            self._adj_masks[j]|=1<<i
 
+    def adjacency_matrix(self)->np.ndarray:
+        """
+        Get the (n+1)x(n+1) boolean adjacency matrix of the graph, row and column 0 are unused.
+        """
+        matrix=np.zeros((self.n_vertices+1,self.n_vertices+1),dtype=bool)
+        first,second=self.edge_arrays()
+        matrix[first,second]=True
+        matrix[second,first]=True
+        return matrix
+
+    def has_edge(self,i,j)->bool:
+        """
+        Check if there is an edge between vertices i and j.
+        """
+        return j in self.neighbours[i]
+
+    def degree(self,v: int)->int:
+        return len(self.neighbours[v])
+
+    def neighbourhood(self,v: int)->set:
+        return self.neighbours[v]
+
+    def local_masks(self,vertices: list)->list:
+        """
+        Get the adjacency bitmasks of the subgraph induced by some vertices, numbered by their position in the list.
+
+        Args:
+            vertices (list): Vertices of the subgraph.
+
+        Returns:
+            list: Bitmask of every vertex, bit i set if it is adjacent to vertices[i].
+        """
+        index={v:i for i,v in enumerate(vertices)}
+        masks=[]
+        for v in vertices:
+            mask=0
+            for u in self.neighbours[v]:
+                i=index.get(u)
+                if i is not None:
+                    mask|=1<<i
+            masks.append(mask)
+        return masks
 
     def add_node(self):
         self.n_vertices=self.n_vertices+1
+        self.neighbours.append(set())
+        if self._adj_masks is not None:
+            self._adj_masks.append(0)
+
+    def add_edge(self,i,j):
+        """
+        Add the edge i--j to the graph, keeping the adjacency sets and bitmasks current.
+
+        Args:
+            i (int): First vertex of the edge.
+            j (int): Second vertex of the edge.
+        """
+        assert(i!=j and 1<=i<=self.n_vertices and 1<=j<=self.n_vertices),"invalid edge"
+        assert(not self.has_edge(i,j)),"edge already exists"
+        self.edges.append((i,j))
+        self.__link(i,j)
 
-def random_graph(n: int,e: int)->graph:
+def random_graph(n: int,e: int,seed=None)->graph:
     """
     Create a random graph with n vertices and e edges.
 
     Args:
         n (int): Number of vertices.
         e (int): Number of edges.
+        seed: Seed or np.random.Generator used to pick the edges, so graphs can be recreated.
 
     Returns:
         graph: Graph created with n vertices, and e random edges.
     """
     assert (n>=1),"invalid number of vertices"
     assert (0<=e<=(n*(n-1))/2),"invalid number of edges"
-    nodes = range(1,n+1)
-    edges=[]
-    while len(edges)<e:
-        i = random.randrange(1,len(nodes)+1)
-        j=random.randrange(1,len(nodes)+1)
-        while i==j:
-            j=random.randrange(1,len(nodes)+1)
-        if (i,j) in edges or (j,i) in edges:
-            continue
-        else:
-            edges.append((i,j))
-    return graph(n,edges)
+    return graph.from_arrays(n,*gnm_edges(n,int(e),seed))
+
+def random_graph_p(n: int,p: float,seed=None)->graph:
+    """
+    Create a random graph with n vertices where each possible edge exists with chance p.
+
+    Args:
+        n (int): Number of vertices.
+        p (float): Chance of each edge.
+        seed: Seed or np.random.Generator used to pick the edges, so graphs can be recreated.
+
+    Returns:
+        graph: Graph created with n vertices, and random edges.
+    """
+    return graph.from_arrays(n,*gnp_edges(n,p,seed))
 
 
-def max_clique(graph: graph)->(list,int,int,float):
+def max_clique(graph: graph,engine: str="exhaustive",reduce: bool=False,mode: str="list",**options):
     """
     Get the max clique/s for a given graph.
-    The main algorithm used for this assignment.
+    The main algorithm used for this assignment is the exhaustive engine, the others are there to compare against it.
 
     Args:
         graph (graph): Graph to find max clique from
+        engine (str): Algorithm to use, one of the keys of ENGINES ("exhaustive", "numpy", "lazy", "bk", "bnb", "mitm" or the heuristic "anytime").
+        reduce (bool): Shrink the graph with max_clique_reduced before handing it to the engine.
+        mode (str): "list" to get the solutions from the engine, "count" to only count them (count_max_cliques)
+            or "iter" to get them one at a time from a generator (iter_max_cliques). The last two don't keep
+            the solutions in memory and always enumerate with Bron-Kerbosch, so engine is ignored and reduce and options can't be given.
+        **options: Extra arguments for the engine, like workers for the exhaustive engine. Every engine takes instrument
+            (see max_clique_exhaustive), but only the ones in INSTRUMENTED_ENGINES break the counters down by level or skip counting.
 
     Returns:
         list,int,int,float: list of solutions, number of occurrences of the innermost operation, number of configurations generated, executing time.
+        In "count" mode the number of solutions takes the place of the list, and in "iter" mode a generator of the solutions is returned.
     """
+    assert (engine in ENGINES),"invalid engine"
+    assert (mode in ("list","count","iter")),"invalid mode"
+    assert (mode=="list" or (not reduce and not options)),"reduce and engine options can't be used with the count and iter modes"
+    if mode=="count":
+        return count_max_cliques(graph)
+    if mode=="iter":
+        return iter_max_cliques(graph)
+    if reduce:
+        return max_clique_reduced(graph,engine,**options)
+    return _run_engine(graph,engine,options)
+
+def _run_engine(graph: graph,engine: str,options: dict)->(list,int,int,float):
+    """
+    Run an engine, taking the instrument option for every engine: the ones in INSTRUMENTED_ENGINES handle it themselves,
+    the others always count and only have their totals recorded in a counters object after they return.
+    """
+    if engine in INSTRUMENTED_ENGINES or "instrument" not in options:
+        return ENGINES[engine](graph,**options)
+    options=dict(options)
+    instrument=options.pop("instrument")
+    results=ENGINES[engine](graph,**options)
+    if isinstance(instrument,counters):
+        instrument.record_totals(results[1],results[2],results[3])
+    return results
+
+class counters:
+    """
+    Instrumentation an engine reports to when it is given one as its instrument option.
+    Keeps the totals of basic operations, configurations and time, and their breakdown by level:
+    the size of the subsets for the exhaustive engine, the size of the current clique for the bk engine.
+    Other engines only add to the totals.
+    """
+    def __init__(self):
+        self.n_innermost_inst=0
+        self.n_configurations=0
+        self.ops_by_level={}
+        self.configs_by_level={}
+        self.time_by_level={}
+        self.time=0.0
+
+    def record(self,level: int,ops: int=0,configs: int=0,elapsed: float=0.0)->None:
+        self.n_innermost_inst+=ops
+        self.n_configurations+=configs
+        self.ops_by_level[level]=self.ops_by_level.get(level,0)+ops
+        self.configs_by_level[level]=self.configs_by_level.get(level,0)+configs
+        self.time_by_level[level]=self.time_by_level.get(level,0.0)+elapsed
+        self.time+=elapsed
+
+    def record_totals(self,ops: int,configs: int,elapsed: float)->None:
+        """
+        Add the counters of an engine that doesn't break them down by level.
+        """
+        self.n_innermost_inst+=ops
+        self.n_configurations+=configs
+        self.time+=elapsed
+
+    def __str__(self):
+        levels=sorted(self.ops_by_level)
+        lines=["level ops configs time"]
+        lines+=["%d %d %d %f" % (k,self.ops_by_level[k],self.configs_by_level[k],self.time_by_level[k]) for k in levels]
+        lines.append("total %d %d %f" % (self.n_innermost_inst,self.n_configurations,self.time))
+        return "\n".join(lines)
+
+def max_clique_exhaustive(graph: graph,workers: int=None,instrument=True,checkpoint: str=None,rank_range: tuple=None,interval: float=DEFAULT_CHECKPOINT_INTERVAL)->(list,int,int,float):
+    """
+    Get the max clique/s for a given graph by checking every subset of vertices.
+
+    Args:
+        graph (graph): Graph to find max clique from
+        workers (int): Number of processes to split the search over, the search runs in this process when None or 1.
+        instrument: True to count the basic operations and configurations, a counters object to also get
+            them (and the time) by subset size, or False to skip the counting with _exhaustive_fast.
+        checkpoint (str): Path of a checkpoint file to save the search to and resume it from, see max_clique_checkpointed.
+        rank_range (tuple): Part of the subsets to check, from split_ranks, see max_clique_checkpointed.
+        interval (float): Seconds between checkpoints.
+
+    Returns:
+        list,int,int,float: list of solutions, number of occurrences of the innermost operation, number of configurations generated, executing time.
+        Both counters are None when instrument is False.
+    """
+    assert (workers is None or workers>=1),"invalid number of workers"
+    if checkpoint is not None or rank_range is not None:
+        return max_clique_checkpointed(graph,checkpoint,rank_range,interval)
+    if workers is not None and workers>1:
+        return max_clique_parallel(graph,workers,instrument)
+    if instrument is False:
+        return _exhaustive_fast(graph)
+    report=instrument if isinstance(instrument,counters) else None
     
-    
-    start=time.time()
+    start=time.perf_counter()
     n_configurations=0
     n_innermost_inst=0
     max = 0
     sols = {}
     n_vertices=graph.n_vertices
-    m_edges=graph.edges
+    neighbours=graph.neighbours
     for i in range(1,n_vertices+1):
+        if report is not None:
+            level_start=time.perf_counter()
+            level_ops,level_configs=n_innermost_inst,n_configurations
         comb = list(combinations(range(1,n_vertices+1),i))
         sols[i]=[]
         for c in comb:
@@ -84,29 +358,1164 @@ def max_clique(graph: graph)->(list,int,int,float):
                 
                 for j in range(1,len(c)-a):
                     n_innermost_inst+=1
-                    if  not ((c[a],c[a+j]) in m_edges or (c[a+j],c[a]) in m_edges): #flag and
+                    if  not c[a+j] in neighbours[c[a]]: #flag and
                         flag=False
             
             if flag and len(c)>=max:
                 max=len(c)
                 sols[i].append(c)
-    end = time.time()
+        if report is not None:
+            report.record(i,n_innermost_inst-level_ops,n_configurations-level_configs,time.perf_counter()-level_start)
+    end = time.perf_counter()
     return sols[max],n_innermost_inst,n_configurations,end-start
 
-def basic_op_increasing_n(beg: int,end: int)->None:
+def _exhaustive_fast(graph: graph)->(list,None,None,float):
+    """
+    max_clique_exhaustive without counting: every subset is dropped on its first missing edge,
+    and the search stops at the first size without cliques, since there can't be larger ones.
+    """
+    start=time.perf_counter()
+    sols=[]
+    neighbours=graph.neighbours
+    for i in range(1,graph.n_vertices+1):
+        found=[list(c) for c in combinations(range(1,graph.n_vertices+1),i)
+               if all(c[j] in neighbours[c[a]] for a in range(i-1) for j in range(a+1,i))]
+        if not found:
+            break
+        sols=found
+    end=time.perf_counter()
+    return sols,None,None,end-start
+
+def unrank_combination(n: int,k: int,rank: int)->list:
+    """
+    Get the combination of k vertices out of 1..n at a given position of the lexicographic order
+    (the order itertools.combinations generates them in), using the combinatorial number system.
+
+    Args:
+        n (int): Number of vertices.
+        k (int): Size of the combination.
+        rank (int): Position of the combination, starting at 0.
+
+    Returns:
+        list: The combination.
+    """
+    assert (0<=k<=n and 0<=rank<math.comb(n,k)),"invalid rank"
+    c=[]
+    x=1
+    for i in range(k,0,-1):
+        count=math.comb(n-x,i-1)
+        while rank>=count:
+            rank-=count
+            x+=1
+            count=math.comb(n-x,i-1)
+        c.append(x)
+        x+=1
+    return c
+
+def next_combination(c: list,n: int)->bool:
+    """
+    Turn c into the next combination of 1..n in lexicographic order, in place.
+
+    Args:
+        c (list): Current combination.
+        n (int): Number of vertices.
+
+    Returns:
+        bool: False if c was already the last combination.
+    """
+    k=len(c)
+    i=k-1
+    while i>=0 and c[i]==n-k+i+1:
+        i-=1
+    if i<0:
+        return False
+    c[i]+=1
+    for j in range(i+1,k):
+        c[j]=c[j-1]+1
+    return True
+
+_worker_masks=None
+def _init_worker(adj_masks: list)->None:
+    global _worker_masks
+    _worker_masks=adj_masks
+
+def _exhaustive_chunk(n_vertices: int,size: int,rank: int,count: int)->(list,int,int):
+    """
+    Check count subsets of a given size, starting at a given lexicographic rank, against the masks sent to this worker.
+
+    Returns:
+        list,int,int: cliques found, number of occurrences of the innermost operation, number of configurations generated.
+    """
+    return _check_range(_worker_masks,n_vertices,size,rank,count)
+
+def _check_range(adj: list,n_vertices: int,size: int,rank: int,count: int)->(list,int,int):
+    """
+    Check count subsets of a given size, starting at a given lexicographic rank, against the adjacency bitmasks.
+    The counters are the ones max_clique_exhaustive would count for those subsets.
+
+    Returns:
+        list,int,int: cliques found, number of occurrences of the innermost operation, number of configurations generated.
+    """
+    cliques=[]
+    c=unrank_combination(n_vertices,size,rank)
+    for _ in range(count):
+        c_mask=0
+        for v in c:
+            c_mask|=1<<v
+        if all((adj[v]|(1<<v))&c_mask==c_mask for v in c):
+            cliques.append(list(c))
+        next_combination(c,n_vertices)
+    return cliques,count*(size*(size-1)//2),count
+
+def graph_digest(graph: graph)->bytes:
+    """
+    Get a sha256 digest of the number of vertices and the sorted edges (each as low,high) of a graph,
+    the same however its edges were given, and for a graph and its csr_graph form.
+    """
+    first,second=graph.edge_arrays()
+    low=np.minimum(first,second).astype(np.int64)
+    high=np.maximum(first,second).astype(np.int64)
+    order=np.lexsort((high,low))
+    h=hashlib.sha256()
+    h.update(np.int64(graph.n_vertices).tobytes())
+    h.update(low[order].tobytes())
+    h.update(high[order].tobytes())
+    return h.digest()
+
+def split_ranks(n_vertices: int,parts: int)->list:
+    """
+    Cut the subsets checked by max_clique_exhaustive into rank ranges of about the same length.
+    Subsets are ranked globally: the C(n,1) subsets of size 1 first, then the ones of size 2 and so on,
+    each size in lexicographic order, so there are 2^n-1 ranks.
+
+    Returns:
+        list: (begin,end) rank ranges, end excluded, to give to max_clique_checkpointed.
+    """
+    assert (parts>=1),"invalid number of parts"
+    total=2**n_vertices-1
+    bounds=[total*i//parts for i in range(parts+1)]
+    return [(bounds[i],bounds[i+1]) for i in range(parts) if bounds[i]<bounds[i+1]]
+
+def _write_checkpoint(path: str,state: dict)->None:
+    ##written to a temporary file first, so a crash while writing leaves the last checkpoint intact
+    with open(path+".tmp","w",encoding="utf-8") as f:
+        json.dump(state,f)
+    os.replace(path+".tmp",path)
+
+def max_clique_checkpointed(graph: graph,checkpoint: str=None,rank_range: tuple=None,interval: float=DEFAULT_CHECKPOINT_INTERVAL)->(list,int,int,float):
+    """
+    Same search as max_clique_exhaustive, over a range of the global subset ranks of split_ranks, saving its position to a checkpoint file.
+    The file (JSON) holds the digest of the graph, the rank range, the next rank to check, the size and cliques of the best cliques so far,
+    the counters and the time spent. When the file already exists the search resumes from it, and since the subsets come in a fixed order,
+    the results are the same as the ones of an uninterrupted run. Finished checkpoints of the ranges of a split are put together with merge_checkpoints.
+
+    Args:
+        graph (graph): Graph to find max clique from
+        checkpoint (str): Path of the checkpoint file, nothing is saved when None.
+        rank_range (tuple): (begin,end) global ranks to check, end excluded, every subset when None.
+        interval (float): Seconds between checkpoints, one is also saved when the range is done.
+
+    Returns:
+        list,int,int,float: list of solutions, number of occurrences of the innermost operation, number of configurations generated, executing time.
+        The solutions are the largest cliques of the range, which may not be max cliques of the graph when the range is a part of a split.
+    """
+    start=time.perf_counter()
+    n_vertices=graph.n_vertices
+    digest=graph_digest(graph).hex()
+    begin,end=rank_range if rank_range is not None else (0,2**n_vertices-1)
+    assert (0<=begin<=end<=2**n_vertices-1),"invalid rank range"
+    if checkpoint is not None and os.path.exists(checkpoint):
+        with open(checkpoint,"r",encoding="utf-8") as f:
+            state=json.load(f)
+        assert (state["digest"]==digest and state["begin"]==begin and state["end"]==end),"checkpoint of another graph or range"
+    else:
+        state={"digest":digest,"n_vertices":n_vertices,"begin":begin,"end":end,"next":begin,
+               "max_size":0,"sols":[],"n_innermost_inst":0,"n_configurations":0,"time":0.0}
+    elapsed=state["time"]
+    adj=graph.adj_masks
+    ##size and rank within the size of the next subset
+    size=1
+    rank=state["next"]
+    while size<=n_vertices and rank>=math.comb(n_vertices,size):
+        rank-=math.comb(n_vertices,size)
+        size+=1
+    last_save=time.perf_counter()
+    while state["next"]<end:
+        count=min(CHECKPOINT_BLOCK,math.comb(n_vertices,size)-rank,end-state["next"])
+        cliques,ops,configs=_check_range(adj,n_vertices,size,rank,count)
+        state["n_innermost_inst"]+=ops
+        state["n_configurations"]+=configs
+        if cliques:
+            if size>state["max_size"]:
+                state["max_size"]=size
+                state["sols"]=[]
+            state["sols"]+=cliques
+        state["next"]+=count
+        rank+=count
+        if rank==math.comb(n_vertices,size):
+            size+=1
+            rank=0
+        now=time.perf_counter()
+        if checkpoint is not None and now-last_save>=interval:
+            state["time"]=elapsed+now-start
+            _write_checkpoint(checkpoint,state)
+            last_save=now
+    state["time"]=elapsed+time.perf_counter()-start
+    if checkpoint is not None:
+        _write_checkpoint(checkpoint,state)
+    return state["sols"],state["n_innermost_inst"],state["n_configurations"],state["time"]
+
+def merge_checkpoints(paths: list)->(list,int,int,float):
+    """
+    Put together the finished checkpoints of the ranges of a split, as if the whole search had run at once.
+    The ranges must cover every subset of the graph with no gaps, in any order.
+
+    Args:
+        paths (list): Paths of the checkpoint files.
+
+    Returns:
+        list,int,int,float: list of solutions, number of occurrences of the innermost operation, number of configurations generated, sum of the executing times.
+    """
+    states=[]
+    for path in paths:
+        with open(path,"r",encoding="utf-8") as f:
+            states.append(json.load(f))
+    states.sort(key=lambda state:state["begin"])
+    assert (states and len({state["digest"] for state in states})==1),"checkpoints of different graphs"
+    assert (states[0]["begin"]==0 and states[-1]["end"]==2**states[0]["n_vertices"]-1),"ranges don't cover every subset"
+    n_innermost_inst=0
+    n_configurations=0
+    total_time=0.0
+    max_size=0
+    sols=[]
+    for i,state in enumerate(states):
+        assert (state["next"]==state["end"]),"unfinished checkpoint"
+        assert (i==0 or states[i-1]["end"]==state["begin"]),"ranges don't cover every subset"
+        n_innermost_inst+=state["n_innermost_inst"]
+        n_configurations+=state["n_configurations"]
+        total_time+=state["time"]
+        if state["sols"]:
+            if state["max_size"]>max_size:
+                max_size=state["max_size"]
+                sols=[]
+            if state["max_size"]==max_size:
+                sols+=state["sols"]
+    return sols,n_innermost_inst,n_configurations,total_time
+
+def max_clique_parallel(graph: graph,workers: int,instrument=True)->(list,int,int,float):
+    """
+    Same search as max_clique_exhaustive, split over a pool of processes.
+    The subsets of every size are cut into rank ranges of about the same length, the adjacency bitmasks are
+    sent once to each worker, and the cliques and counters of every range are merged back in order,
+    so the solutions and counters match the single process search.
+
+    Args:
+        graph (graph): Graph to find max clique from
+        workers (int): Number of processes to use.
+        instrument: A counters object to also get the counters by subset size (without times), the workers always count.
+
+    Returns:
+        list,int,int,float: list of solutions, number of occurrences of the innermost operation, number of configurations generated, executing time.
+    """
+    report=instrument if isinstance(instrument,counters) else None
+    start=time.perf_counter()
+    n_vertices=graph.n_vertices
+    chunk=max(1,math.ceil((2**n_vertices-1)/(workers*CHUNKS_PER_WORKER)))
+    tasks=[]
+    for i in range(1,n_vertices+1):
+        total=math.comb(n_vertices,i)
+        for rank in range(0,total,chunk):
+            tasks.append((i,rank,min(chunk,total-rank)))
+    n_innermost_inst=0
+    n_configurations=0
+    max_size=0
+    sols=[]
+    with ProcessPoolExecutor(max_workers=workers,initializer=_init_worker,initargs=(graph.adj_masks,)) as executor:
+        futures=[executor.submit(_exhaustive_chunk,n_vertices,i,rank,count) for i,rank,count in tasks]
+        for (i,_,_),future in zip(tasks,futures):
+            cliques,ops,configs=future.result()
+            n_innermost_inst+=ops
+            n_configurations+=configs
+            if report is not None:
+                report.record(i,ops,configs)
+            if cliques:
+                if i>max_size:
+                    max_size=i
+                    sols=[]
+                sols+=cliques
+    end=time.perf_counter()
+    return sols,n_innermost_inst,n_configurations,end-start
+
+def verify_cliques(candidates: np.ndarray,adjacency: np.ndarray)->np.ndarray:
+    """
+    Check a block of vertex subsets of the same size for cliques all at once.
+
+    Args:
+        candidates (np.ndarray): 2-D array with one subset of vertices per row.
+        adjacency (np.ndarray): Boolean adjacency matrix, as returned by graph.adjacency_matrix.
+
+    Returns:
+        np.ndarray: Boolean array telling which rows are cliques.
+    """
+    first,second=np.triu_indices(candidates.shape[1],1)
+    return adjacency[candidates[:,first],candidates[:,second]].all(axis=1)
+
+def max_clique_numpy(graph: graph,batch_size: int=DEFAULT_BATCH_SIZE)->(list,int,int,float):
+    """
+    Same search as max_clique_exhaustive, with the subsets checked in blocks of batch_size by verify_cliques.
+    Subsets are pulled from the combinations generator one block at a time, so memory stays bounded.
+    The counters are worked out per block, and match the ones of max_clique_exhaustive.
+
+    Args:
+        graph (graph): Graph to find max clique from
+        batch_size (int): Number of subsets checked at once.
+
+    Returns:
+        list,int,int,float: list of solutions, number of occurrences of the innermost operation, number of configurations generated, executing time.
+    """
+    assert (batch_size>=1),"invalid batch size"
+    start=time.perf_counter()
+    n_configurations=0
+    n_innermost_inst=0
+    sols=[]
+    n_vertices=graph.n_vertices
+    adjacency=graph.adjacency_matrix()
+    for i in range(1,n_vertices+1):
+        comb=combinations(range(1,n_vertices+1),i)
+        found=[]
+        while True:
+            block=np.fromiter(chain.from_iterable(islice(comb,batch_size)),dtype=np.int64)
+            if not block.size:
+                break
+            block=block.reshape(-1,i)
+            n_configurations+=len(block)
+            n_innermost_inst+=len(block)*(i*(i-1)//2)
+            found+=block[verify_cliques(block,adjacency)].tolist()
+        if found:
+            sols=found
+    end=time.perf_counter()
+    return sols,n_innermost_inst,n_configurations,end-start
+
+def max_clique_lazy(graph: graph)->(list,int,int,float):
+    """
+    Get the max clique/s for a given graph by checking subsets from the largest size down.
+    Subsets are streamed from a generator instead of being stored in a list, sizes above the max degree + 1 are skipped,
+    vertices with too small a degree are left out of each size, and every subset is dropped on its first missing edge.
+    The search stops at the first size that has a clique, so memory stays O(n) besides the solutions.
+
+    Args:
+        graph (graph): Graph to find max clique from
+
+    Returns:
+        list,int,int,float: list of solutions, number of occurrences of the innermost operation, number of configurations generated, executing time.
+    """
+    start=time.perf_counter()
+    n_configurations=0
+    n_innermost_inst=0
+    sols=[]
+    n_vertices=graph.n_vertices
+    neighbours=graph.neighbours
+    max_degree=max((len(neighbours[v]) for v in range(1,n_vertices+1)),default=-1)
+    for i in range(min(n_vertices,max_degree+1),0,-1):
+        candidates=[v for v in range(1,n_vertices+1) if len(neighbours[v])>=i-1]
+        for c in combinations(candidates,i):
+            n_configurations+=1
+            flag=True
+            for a in range(i-1):
+                adjacent=neighbours[c[a]]
+                for j in range(a+1,i):
+                    n_innermost_inst+=1
+                    if not c[j] in adjacent:
+                        flag=False
+                        break
+                if not flag:
+                    break
+            if flag:
+                sols.append(list(c))
+        if sols:
+            break
+    end=time.perf_counter()
+    return sols,n_innermost_inst,n_configurations,end-start
+
+def _bits(mask: int):
+    """
+    Yield the vertices whose bits are set in mask, lowest first.
+    """
+    while mask:
+        low=mask&-mask
+        yield low.bit_length()-1
+        mask^=low
+
+def _popcount(mask: int)->int:
+    return bin(mask).count("1")
+
+def degeneracy_order(graph: graph)->list:
+    """
+    Order the vertices of a graph by repeatedly removing one with the smallest remaining degree.
+    Uses a bucket queue, so it runs in O(V+E). Only needs degree and neighbourhood queries, so it works on csr_graph too.
+
+    Args:
+        graph (graph): Graph to order.
+
+    Returns:
+        list: Vertices in removal order.
+    """
+    n=graph.n_vertices
+    degree=[0]+[graph.degree(v) for v in range(1,n+1)]
+    buckets=[set() for _ in range(n+1)]
+    for v in range(1,n+1):
+        buckets[degree[v]].add(v)
+    removed=[False]*(n+1)
+    order=[]
+    d=0
+    for _ in range(n):
+        while not buckets[d]:
+            d+=1
+        v=buckets[d].pop()
+        removed[v]=True
+        order.append(v)
+        for u in graph.neighbourhood(v):
+            u=int(u)
+            if not removed[u]:
+                buckets[degree[u]].discard(u)
+                degree[u]-=1
+                buckets[degree[u]].add(u)
+        d=max(d-1,0)
+    return order
+
+class bk_search:
+    """
+    State of a Bron-Kerbosch search for max cliques, with Tomita pivoting and bitmask candidate sets.
+    Keeps the largest cliques found (of size at least max) and counts recursive calls and maximal cliques reached.
+    Branches that can no longer reach max are cut.
+    When the masks are local to a subgraph, names maps bits back to vertices, and the vertices of base are part of every clique.
+    When report is a counters object, every call and maximal clique is also recorded there by the size of its clique.
+    """
+    def __init__(self,adj_masks: list,max: int=0,names: list=None,base: list=(),report: counters=None):
+        self.adj=adj_masks
+        self.max=max
+        self.names=names
+        self.base=list(base)
+        self.report=report
+        self.sols=[]
+        self.n_rec_calls=0
+        self.n_configurations=0
+
+    def expand(self,r: list,p: int,x: int)->None:
+        """
+        Look for the cliques that extend r with vertices of p, excluding the ones already covered by x.
+
+        Args:
+            r (list): Current clique.
+            p (int): Bitmask of the vertices that can still be added to r.
+            x (int): Bitmask of the vertices that were already tried with r.
+        """
+        adj=self.adj
+        self.n_rec_calls+=1
+        size=len(self.base)+len(r)
+        if self.report is not None:
+            self.report.record(size,1,0 if p or x else 1)
+        if not p:
+            if not x:
+                self.n_configurations+=1
+                if size>=self.max:
+                    clique=sorted(self.base+(r if self.names is None else [self.names[i] for i in r]))
+                    if size>self.max:
+                        self.max=size
+                        self.sols=[clique]
+                    else:
+                        self.sols.append(clique)
+            return
+        if size+_popcount(p)<self.max:
+            return
+        pivot=0
+        pivot_deg=-1
+        for u in _bits(p|x):
+            deg=_popcount(p&adj[u])
+            if deg>pivot_deg:
+                pivot,pivot_deg=u,deg
+        for v in _bits(p&~adj[pivot]):
+            self.expand(r+[v],p&adj[v],x&adj[v])
+            p&=~(1<<v)
+            x|=1<<v
+
+    def iter_expand(self,r: list,p: int,x: int):
+        """
+        Like expand, but yield the cliques of size max instead of keeping them, so max never changes
+        and memory stays bounded by the depth of the search.
+        """
+        adj=self.adj
+        self.n_rec_calls+=1
+        size=len(self.base)+len(r)
+        if self.report is not None:
+            self.report.record(size,1,0 if p or x else 1)
+        if not p:
+            if not x:
+                self.n_configurations+=1
+                if size==self.max:
+                    yield sorted(self.base+(r if self.names is None else [self.names[i] for i in r]))
+            return
+        if size+_popcount(p)<self.max:
+            return
+        pivot=0
+        pivot_deg=-1
+        for u in _bits(p|x):
+            deg=_popcount(p&adj[u])
+            if deg>pivot_deg:
+                pivot,pivot_deg=u,deg
+        for v in _bits(p&~adj[pivot]):
+            yield from self.iter_expand(r+[v],p&adj[v],x&adj[v])
+            p&=~(1<<v)
+            x|=1<<v
+
+def max_clique_bk(graph: graph,instrument=True)->(list,int,int,float):
+    """
+    Get the max clique/s for a given graph with the Bron-Kerbosch algorithm, using Tomita pivoting
+    and a degeneracy ordering of the outer level. Candidate sets are kept as bitmasks.
+    Every vertex of the outer level is searched on the bitmasks of its own neighbourhood only,
+    so it also works on large sparse graphs (csr_graph) through their degree and neighbourhood queries.
+    Branches that can no longer reach the best size found so far are cut, so only maximum cliques are kept.
+
+    Args:
+        graph (graph): Graph to find max clique from
+        instrument: A counters object to also get the counters by clique size. Counting is one addition per call,
+            small next to the pivot choice, so there is no separate path without it.
+
+    Returns:
+        list,int,int,float: list of solutions, number of recursive calls, number of maximal cliques reached, executing time.
+    """
+    start=time.perf_counter()
+    order=degeneracy_order(graph)
+    position=[0]*(graph.n_vertices+1)
+    for i,v in enumerate(order):
+        position[v]=i
+    search=bk_search([],report=instrument if isinstance(instrument,counters) else None)
+    for v in order:
+        later=[]
+        earlier=[]
+        for u in graph.neighbourhood(v):
+            u=int(u)
+            if position[u]>position[v]:
+                later.append(u)
+            else:
+                earlier.append(u)
+        if len(later)+1<search.max:
+            continue
+        local=later+earlier
+        search.adj=graph.local_masks(local)
+        search.names=local
+        search.base=[v]
+        p=(1<<len(later))-1
+        search.expand([],p,((1<<len(local))-1)^p)
+    search.sols.sort()
+    end=time.perf_counter()
+    return search.sols,search.n_rec_calls,search.n_configurations,end-start
+
+def iter_max_cliques(graph: graph,search: bk_search=None):
+    """
+    Yield the max cliques of a graph one at a time, in no particular order, without keeping them.
+    The size of a max clique is found first with max_clique_bnb, then the Bron-Kerbosch search of max_clique_bk
+    is run with that size as its bound, so only max cliques are reached and yielded.
+
+    Args:
+        graph (graph): Graph to find max cliques from
+        search (bk_search): Search to run, to read its counters afterwards. A new one is used when None.
+
+    Yields:
+        list: Every max clique, sorted.
+    """
+    if search is None:
+        search=bk_search([])
+    best=max_clique_bnb(graph)[0]
+    if not best:
+        return
+    search.max=len(best[0])
+    order=degeneracy_order(graph)
+    position=[0]*(graph.n_vertices+1)
+    for i,v in enumerate(order):
+        position[v]=i
+    for v in order:
+        later=[]
+        earlier=[]
+        for u in graph.neighbourhood(v):
+            u=int(u)
+            if position[u]>position[v]:
+                later.append(u)
+            else:
+                earlier.append(u)
+        if len(later)+1<search.max:
+            continue
+        local=later+earlier
+        search.adj=graph.local_masks(local)
+        search.names=local
+        search.base=[v]
+        p=(1<<len(later))-1
+        yield from search.iter_expand([],p,((1<<len(local))-1)^p)
+
+def count_max_cliques(graph: graph)->(int,int,int,float):
+    """
+    Count the max cliques of a graph without keeping them, with iter_max_cliques.
+
+    Args:
+        graph (graph): Graph to count max cliques from
+
+    Returns:
+        int,int,int,float: number of max cliques, number of recursive calls and of maximal cliques reached by the enumeration, executing time.
+    """
+    start=time.perf_counter()
+    search=bk_search([])
+    count=0
+    for _ in iter_max_cliques(graph,search):
+        count+=1
+    end=time.perf_counter()
+    return count,search.n_rec_calls,search.n_configurations,end-start
+
+def max_clique_bnb(graph: graph,initial: list=None)->(list,int,int,float):
+    """
+    Get a max clique for a given graph with branch and bound, in the style of Tomita's MCQ and San Segundo's BBMC.
+    Vertices are renumbered by decreasing degree and candidate sets are bitsets over that numbering.
+    On every node the candidates are greedily coloured, and a branch is cut as soon as
+    the size of the current clique plus the number of colours left can't beat the best clique found.
+    Only one maximum clique is returned, since ties are cut too.
+
+    Args:
+        graph (graph): Graph to find max clique from
+        initial (list): A clique to start from as the best one found, like the one max_clique_anytime returns.
+
+    Returns:
+        list,int,int,float: list with one solution, number of recursive calls, number of vertices branched on, executing time.
+    """
+    start=time.perf_counter()
+    n_rec_calls=0
+    n_configurations=0
+    order=sorted(range(1,graph.n_vertices+1),key=graph.degree,reverse=True)
+    adj=graph.local_masks(order)
+    position={v:i for i,v in enumerate(order)}
+    best=[position[v] for v in initial] if initial else []
+
+    def colour_sort(p: int)->(list,list):
+        vertices=[]
+        colours=[]
+        k=0
+        while p:
+            k+=1
+            q=p
+            while q:
+                low=q&-q
+                v=low.bit_length()-1
+                q&=~(adj[v]|low)
+                p&=~low
+                vertices.append(v)
+                colours.append(k)
+        return vertices,colours
+
+    def expand(c: list,p: int)->None:
+        nonlocal n_rec_calls,n_configurations,best
+        n_rec_calls+=1
+        vertices,colours=colour_sort(p)
+        for i in range(len(vertices)-1,-1,-1):
+            if len(c)+colours[i]<=len(best):
+                return
+            v=vertices[i]
+            n_configurations+=1
+            c.append(v)
+            new_p=p&adj[v]
+            if new_p:
+                expand(c,new_p)
+            elif len(c)>len(best):
+                best=c[:]
+            c.pop()
+            p&=~(1<<v)
+
+    expand([],(1<<len(order))-1)
+    sols=[sorted(order[i] for i in best)] if best else []
+    end=time.perf_counter()
+    return sols,n_rec_calls,n_configurations,end-start
+
+def max_clique_anytime(graph: graph,time_budget: float=None,max_ops: int=None,callback=None,seed=None,tabu_tenure: int=DEFAULT_TABU_TENURE)->(list,int,int,float):
+    """
+    Get a large clique for a given graph within a time or operation budget, with no guarantee that it is a max clique.
+    Starts from a greedy clique and then runs a local search in the style of Grosso, Locatelli and Pullan:
+    add a vertex adjacent to the whole clique if there is one, otherwise swap in a vertex adjacent to all but one
+    of the clique's vertices, otherwise drop a vertex. Vertices taken out of the clique are tabu for tabu_tenure steps,
+    and the search restarts from a random vertex when it hasn't improved for a while.
+
+    Args:
+        graph (graph): Graph to find a clique in.
+        time_budget (float): Seconds the search can run for.
+        max_ops (int): Number of moves the search can make, DEFAULT_ANYTIME_OPS if no budget is given.
+        callback: Function called as callback(clique, ops, elapsed time) every time a larger clique is found.
+        seed: Seed of the random choices.
+        tabu_tenure (int): Number of moves a removed vertex can't be added back.
+
+    Returns:
+        list,int,int,float: list with the best clique found, number of moves, number of cliques visited (one per move or restart), executing time.
+    """
+    if time_budget is None and max_ops is None:
+        max_ops=DEFAULT_ANYTIME_OPS
+    start=time.perf_counter()
+    rng=random.Random(seed)
+    n=graph.n_vertices
+    vertices=list(range(1,n+1))
+    adj=graph.local_masks(vertices)
+    every=(1<<n)-1
+    n_moves=0
+    n_configurations=0
+    best=0
+    best_size=0
+    tabu={}
+
+    def greedy(clique: int,candidates: int)->int:
+        while candidates:
+            v=max(_bits(candidates),key=lambda u:_popcount(adj[u]&candidates))
+            clique|=1<<v
+            candidates&=adj[v]
+        return clique
+
+    def improved(clique: int)->None:
+        nonlocal best,best_size
+        best=clique
+        best_size=_popcount(clique)
+        if callback is not None:
+            callback([vertices[i] for i in _bits(best)],n_moves,time.perf_counter()-start)
+
+    if n:
+        clique=greedy(0,every)
+        improved(clique)
+        stale=0
+        while (max_ops is None or n_moves<max_ops) and (time_budget is None or time.perf_counter()-start<time_budget):
+            n_moves+=1
+            n_configurations+=1
+            allowed=every&~clique
+            for v,until in list(tabu.items()):
+                if until<=n_moves:
+                    del tabu[v]
+                else:
+                    allowed&=~(1<<v)
+            common=every
+            for v in _bits(clique):
+                common&=adj[v]
+            add=common&allowed
+            if add:
+                v=max(_bits(add),key=lambda u:(_popcount(adj[u]&add),rng.random()))
+                clique|=1<<v
+            else:
+                swaps=[]
+                for w in _bits(allowed):
+                    missing=clique&~adj[w]
+                    if missing&(missing-1)==0:
+                        swaps.append((w,missing))
+                if swaps:
+                    w,missing=rng.choice(swaps)
+                    clique=(clique&~missing)|(1<<w)
+                    tabu[missing.bit_length()-1]=n_moves+tabu_tenure
+                elif clique:
+                    v=rng.choice(list(_bits(clique)))
+                    clique&=~(1<<v)
+                    tabu[v]=n_moves+tabu_tenure
+                else:
+                    stale=n
+            if _popcount(clique)>best_size:
+                improved(clique)
+                stale=0
+            else:
+                stale+=1
+            if stale>n:
+                v=rng.randrange(n)
+                clique=greedy(1<<v,adj[v])
+                n_configurations+=1
+                tabu.clear()
+                stale=0
+                if _popcount(clique)>best_size:
+                    improved(clique)
+    sols=[[vertices[i] for i in _bits(best)]] if best else []
+    end=time.perf_counter()
+    return sols,n_moves,n_configurations,end-start
+
+def max_clique_mitm(graph: graph,table_bits: int=DEFAULT_MITM_TABLE_BITS,chunk_bits: int=DEFAULT_MITM_CHUNK_BITS)->(list,int,int,float):
+    """
+    Get the max clique/s for a given graph by splitting its vertices in two halves, meant for dense graphs up to about 50 vertices.
+    For every subset S of the first half B, best[S] (the size of the largest clique inside S) is filled by dynamic programming
+    over the highest vertex of S, in numpy blocks, into a table of 2^|B| bytes (array('B')).
+    Every clique C of the other half A is then matched with best[common neighbours of C in B].
+    The cliques of A are built in chunks: the cliques of its first chunk_bits vertices are tabled once, and are
+    checked all at once against every clique of the remaining vertices of A.
+    The max cliques are rebuilt from best by backtracking, so the running time is about O(2^(n/2)) whatever the density.
+
+    Args:
+        graph (graph): Graph to find max clique from
+        table_bits (int): Largest number of vertices in B, the table takes 2^table_bits bytes.
+        chunk_bits (int): Number of vertices of A tabled at once.
+
+    Returns:
+        list,int,int,float: list of solutions, number of table entries computed, number of cliques of A matched against B, executing time.
+    """
+    start=time.perf_counter()
+    n=graph.n_vertices
+    if n==0:
+        return [],0,0,time.perf_counter()-start
+    masks=graph.local_masks(list(range(1,n+1)))
+    h=min((n+1)//2,table_bits)
+    a=n-h
+    l=min(a,chunk_bits)
+    b_all=(1<<h)-1
+    b_adj=[m&b_all for m in masks]
+    a_adj=[m>>h for m in masks[h:]]
+
+    ##best[S] for every subset S of B, filled one highest vertex at a time
+    table=array("B",bytes(1<<h))
+    best=np.frombuffer(table,dtype=np.uint8)
+    chunk=1<<chunk_bits
+    for v in range(h):
+        size=1<<v
+        lower=b_adj[v]&(size-1)
+        for s in range(0,size,chunk):
+            e=min(size,s+chunk)
+            best[size+s:size+e]=np.maximum(best[s:e],1+best[np.arange(s,e)&lower])
+    n_innermost_inst=1<<h
+
+    ##cliques of the first l vertices of A, with their sizes and common neighbours in B
+    low=1<<l
+    low_clique=np.ones(low,dtype=bool)
+    low_size=np.zeros(low,dtype=np.uint8)
+    low_common=np.full(low,b_all,dtype=np.int64)
+    for j in range(l):
+        size=1<<j
+        idx=np.arange(size)
+        low_clique[size:2*size]=low_clique[:size]&((idx&~a_adj[j])==0)
+        low_size[size:2*size]=low_size[:size]+1
+        low_common[size:2*size]=low_common[:size]&b_adj[h+j]
+    n_innermost_inst+=low
+    low_idx=np.arange(low)
+
+    ##every clique of the rest of A, as (size, common neighbours in B, vertices of the first l of A adjacent to all, vertices)
+    high=[]
+    stack=[(0,b_all,low-1,[],(1<<(a-l))-1)]
+    while stack:
+        size,common,allowed,vertices,candidates=stack.pop()
+        high.append((size,common,allowed,vertices))
+        for j in _bits(candidates):
+            candidates&=~(1<<j)
+            adjacent=a_adj[l+j]
+            stack.append((size+1,common&b_adj[h+l+j],allowed&adjacent,vertices+[h+l+j],candidates&(adjacent>>l)))
+
+    max_size=0
+    matches=[]
+    n_configurations=0
+    for size,common,allowed,vertices in high:
+        valid=low_clique&((low_idx&~allowed)==0)
+        n_innermost_inst+=low
+        n_configurations+=int(np.count_nonzero(valid))
+        values=np.where(valid,size+low_size.astype(np.int64)+best[low_common&common],0)
+        top=int(values.max())
+        if top>max_size:
+            max_size=top
+            matches=[]
+        if top==max_size:
+            for L in np.flatnonzero(values==top).tolist():
+                matches.append((vertices+[h+j for j in _bits(L)],int(low_common[L])&common,top-size-int(low_size[L])))
+
+    def b_cliques(mask: int,k: int)->list:
+        ##every clique of size k inside mask, given that best[mask]==k
+        if k==0:
+            return [[]]
+        v=mask.bit_length()-1
+        rest=mask&~(1<<v)
+        found=[]
+        if best[rest]==k:
+            found+=b_cliques(rest,k)
+        if 1+best[rest&b_adj[v]]==k:
+            found+=[c+[v] for c in b_cliques(rest&b_adj[v],k-1)]
+        return found
+
+    sols=[]
+    for vertices,common,k in matches:
+        for c in b_cliques(common,k):
+            sols.append(sorted(i+1 for i in vertices+c))
+    sols.sort()
+    end=time.perf_counter()
+    return sols,n_innermost_inst,n_configurations,end-start
+
+def greedy_clique(graph: graph,starts: int=DEFAULT_GREEDY_STARTS)->list:
+    """
+    Build a clique greedily from each of the vertices with the largest degrees, always adding the
+    candidate with the largest degree, and keep the largest one. Used as a quick lower bound.
+
+    Args:
+        graph (graph): Graph to find a clique in.
+        starts (int): Number of vertices to start from.
+
+    Returns:
+        list: The largest clique built.
+    """
+    best=[]
+    by_degree=sorted(range(1,graph.n_vertices+1),key=graph.degree,reverse=True)
+    for v in by_degree[:starts]:
+        clique=[v]
+        candidates={int(u) for u in graph.neighbourhood(v)}
+        while candidates:
+            u=max(candidates,key=graph.degree)
+            clique.append(u)
+            candidates.intersection_update(int(w) for w in graph.neighbourhood(u))
+        if len(clique)>len(best):
+            best=clique
+    return sorted(best)
+
+def core_vertices(graph: graph,k: int)->list:
+    """
+    Get the vertices of the k-core of a graph: vertices with degree below k are removed, one at a time,
+    until every vertex left has at least k neighbours left. Runs in O(V+E).
+
+    Args:
+        graph (graph): Graph to peel.
+        k (int): Smallest degree kept.
+
+    Returns:
+        list: Vertices of the k-core, sorted.
+    """
+    n=graph.n_vertices
+    degree=[0]+[graph.degree(v) for v in range(1,n+1)]
+    removed=[False]*(n+1)
+    queue=[v for v in range(1,n+1) if degree[v]<k]
+    for v in queue:
+        removed[v]=True
+    while queue:
+        v=queue.pop()
+        for u in graph.neighbourhood(v):
+            u=int(u)
+            if not removed[u]:
+                degree[u]-=1
+                if degree[u]<k:
+                    removed[u]=True
+                    queue.append(u)
+    return [v for v in range(1,n+1) if not removed[v]]
+
+def connected_components(graph: graph,vertices: list)->list:
+    """
+    Split the subgraph induced by some vertices into its connected components.
+
+    Args:
+        graph (graph): The graph.
+        vertices (list): Vertices of the subgraph.
+
+    Returns:
+        list: Sorted vertex list of every component.
+    """
+    inside=set(vertices)
+    seen=set()
+    components=[]
+    for v in vertices:
+        if v in seen:
+            continue
+        seen.add(v)
+        component=[v]
+        for u in component:
+            for w in graph.neighbourhood(u):
+                w=int(w)
+                if w in inside and w not in seen:
+                    seen.add(w)
+                    component.append(w)
+        components.append(sorted(component))
+    return components
+
+def induced_subgraph(graph: graph,vertices: list)->graph:
+    """
+    Get the subgraph induced by some vertices, with vertices[i] renumbered as i+1.
+    """
+    index={v:i+1 for i,v in enumerate(vertices)}
+    first=[]
+    second=[]
+    for v in vertices:
+        for u in graph.neighbourhood(v):
+            j=index.get(int(u))
+            if j is not None and index[v]<j:
+                first.append(index[v])
+                second.append(j)
+    return type(graph).from_arrays(len(vertices),np.array(first,dtype=np.int64),np.array(second,dtype=np.int64))
+
+def max_clique_reduced(graph: graph,engine: str="bk",**options)->(list,int,int,float):
+    """
+    Shrink a graph before looking for its max cliques: a greedy clique of size b gives a lower bound, so every vertex
+    with less than b-1 neighbours can go (k-core peeling), and the rest is split into connected components.
+    Each component big enough to hold a clique of size b is solved on its own with the given engine,
+    and the cliques are mapped back to the original vertices.
+
+    Args:
+        graph (graph): Graph to find max clique from
+        engine (str): Engine used on every component.
+        **options: Extra arguments for the engine.
+
+    Returns:
+        list,int,int,float: list of solutions, sum of the engine's operation and configuration counters over the components, executing time.
+        The counters are None if the engine didn't count (instrument=False).
+    """
+    start=time.perf_counter()
+    lower_bound=len(greedy_clique(graph))
+    n_innermost_inst=0
+    n_configurations=0
+    max_size=0
+    sols=[]
+    for component in connected_components(graph,core_vertices(graph,lower_bound-1)):
+        if len(component)<max(lower_bound,max_size):
+            continue
+        results=_run_engine(induced_subgraph(graph,component),engine,options)
+        if results[1] is None or n_innermost_inst is None:
+            n_innermost_inst=n_configurations=None
+        else:
+            n_innermost_inst+=results[1]
+            n_configurations+=results[2]
+        if not results[0]:
+            continue
+        cliques=[[component[v-1] for v in clique] for clique in results[0]]
+        if len(cliques[0])>max_size:
+            max_size=len(cliques[0])
+            sols=cliques
+        elif len(cliques[0])==max_size:
+            sols+=cliques
+    sols.sort()
+    end=time.perf_counter()
+    return sols,n_innermost_inst,n_configurations,end-start
+
+class incremental_max_clique:
+    """
+    Class that keeps the max cliques of a graph up to date while nodes and edges are added to it.
+    The graph is solved once with the Bron-Kerbosch engine, after that every new edge u--v only searches
+    the cliques that contain both u and v, using the current max size as the bar to beat.
+    The counters add up the work of every update.
+    """
+    def __init__(self,graph: graph):
+        self.graph=graph
+        self.sols,self.n_rec_calls,self.n_configurations,self.time=max_clique_bk(graph)
+        self.max=len(self.sols[0]) if self.sols else 0
+
+    def add_node(self)->None:
+        """
+        Add an isolated node to the graph, which is only a max clique if there are no edges.
+        """
+        start=time.perf_counter()
+        self.graph.add_node()
+        self.n_rec_calls+=1
+        self.n_configurations+=1
+        if self.max<=1:
+            self.max=1
+            self.sols.append([self.graph.n_vertices])
+        self.time+=time.perf_counter()-start
+
+    def add_edge(self,u: int,v: int)->None:
+        """
+        Add the edge u--v to the graph and update the max cliques with the ones that go through it.
+
+        Args:
+            u (int): First vertex of the edge.
+            v (int): Second vertex of the edge.
+        """
+        start=time.perf_counter()
+        self.graph.add_edge(u,v)
+        adj=self.graph.adj_masks
+        search=bk_search(adj,self.max)
+        search.expand([u,v],adj[u]&adj[v],0)
+        self.n_rec_calls+=search.n_rec_calls
+        self.n_configurations+=search.n_configurations
+        if search.max>self.max:
+            self.max=search.max
+            self.sols=sorted(search.sols)
+        elif search.sols:
+            self.sols=sorted(self.sols+search.sols)
+        self.time+=time.perf_counter()-start
+
+    def solution(self)->(list,int,int,float):
+        """
+        Get the current max cliques, in the same format as max_clique.
+
+        Returns:
+            list,int,int,float: list of solutions, number of recursive calls, number of maximal cliques reached, time spent on the graph so far.
+        """
+        return self.sols,self.n_rec_calls,self.n_configurations,self.time
+
+INSTRUMENTED_ENGINES=("exhaustive","bk")
+
+ENGINES={
+    "exhaustive":max_clique_exhaustive,
+    "bk":max_clique_bk,
+    "bnb":max_clique_bnb,
+    "lazy":max_clique_lazy,
+    "numpy":max_clique_numpy,
+    "anytime":max_clique_anytime,
+    "mitm":max_clique_mitm,
+}
+
+GENERATORS={
+    "gnm":random_graph,
+    "gnp":random_graph_p,
+}
+
+def _batch_task(index: int,spec,seed,engine: str,options: dict)->dict:
+    """
+    Solve one graph of a batch: either a graph, or a (generator, *args) tuple built here with the task's seed.
+    """
+    g=GENERATORS[spec[0]](*spec[1:],seed=seed) if isinstance(spec,tuple) else spec
+    results=max_clique(g,engine,**options)
+    return {"index":index,"n":g.n_vertices,"m":g.n_edges(),"sols":len(results[0]),"ops":results[1],"configs":results[2],"time":results[3]}
+
+def run_batch(specs: list,engine: str="exhaustive",workers: int=None,seed=None,**options):
+    """
+    Solve many independent graphs, yielding the results as they finish.
+    Every task gets its own seed spawned from seed, so a batch can be repeated whatever order the tasks run in.
+    Closing the generator (or breaking out of the loop using it, or Ctrl+C) cancels the tasks that didn't start yet
+    and returns without waiting for the running ones, which the workers finish in the background.
+
+    Args:
+        specs (list): Graphs, or tuples like ("gnm", n, m) or ("gnp", n, p) naming a function of GENERATORS and its arguments.
+        engine (str): max_clique engine to use.
+        workers (int): Number of processes to use (os.cpu_count() to use every core), the tasks run in this process when None.
+        seed: Seed the task seeds are spawned from, fresh entropy is used when None.
+        **options: Extra arguments for the engine.
+
+    Yields:
+        dict: index of the spec, number of vertices and edges, number of solutions, basic operations, configurations and executing time.
+    """
+    assert (workers is None or workers>=1),"invalid number of workers"
+    seeds=np.random.SeedSequence(seed).spawn(len(specs))
+    if workers is None:
+        for i,spec in enumerate(specs):
+            yield _batch_task(i,spec,seeds[i],engine,options)
+        return
+    executor=ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures=[executor.submit(_batch_task,i,spec,seeds[i],engine,options) for i,spec in enumerate(specs)]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        executor.shutdown(wait=False,cancel_futures=True)
+
+def mean_confidence(values: list,confidence: float=DEFAULT_CONFIDENCE)->(float,float):
+    """
+    Get the mean of some values and the half width of its confidence interval (normal approximation).
+
+    Returns:
+        float,float: mean, half width (0 with less than two values).
+    """
+    mean=statistics.fmean(values)
+    if len(values)<2:
+        return mean,0.0
+    z=statistics.NormalDist().inv_cdf((1+confidence)/2)
+    return mean,z*statistics.stdev(values)/math.sqrt(len(values))
+
+def basic_op_increasing_n(beg: int,end: int,engine: str="exhaustive")->None:
     """
     Plot the number of basic operations executed in max_clique for graphs with various #N (number of nodes).
 
     Args:
         beg (int): First #N to plot.
         end (int): Last #N to plot.
+        engine (str): max_clique engine to measure.
     """
     assert (0<=beg and 1<=end and beg<end),"invalid beg/end"
     x=[]
     basic_operations=[]
     g=graph(beg,[])
     for n in range(beg,end+1):
-        results = list(max_clique(g))
+        results = list(max_clique(g,engine))
         x.append(n)
         basic_operations.append(results[1])
         g.add_node()
@@ -118,20 +1527,21 @@ def basic_op_increasing_n(beg: int,end: int)->None:
     plt.ylabel("# basic operations")
     plt.show()
     
-def exec_time_increasing_n(beg: int,end: int)->None:
+def exec_time_increasing_n(beg: int,end: int,engine: str="exhaustive")->None:
     """
     Plot the executing times of max_clique for graphs with various #N (number of nodes).
 
     Args:   
         beg (int): First #N to plot.
         end (int): Last #N to plot.
+        engine (str): max_clique engine to measure.
     """
     assert (0<=beg and 1<=end and beg<end),"invalid beg/end"
     x=[]
     times=[]
     g=graph(beg,[])
     for n in range(beg,end+1):
-        results = list(max_clique(g))
+        results = list(max_clique(g,engine))
         x.append(n)
         times.append(results[3])
         g.add_node()
@@ -144,39 +1554,44 @@ def exec_time_increasing_n(beg: int,end: int)->None:
     plt.show()
 
 
-def sol_config_ratio_increasing_n(beg: int,end: int,sample_size: int)->None:
+def sol_config_ratio_increasing_n(beg: int,end: int,sample_size: int,engine: str="exhaustive",workers: int=None,seed=None)->None:
     """
     Plot the ratios of solutions/configurations created in max_clique for graphs with various #N (number of nodes).
+    Every sample is a random graph with beg nodes that gets one more (isolated) node for each following #N.
+    The samples are solved with run_batch, so they can be spread over several processes.
 
     Args:
         beg (int): First #N to plot.
         end (int): Last #N to plot.
         sample_size (int): Number of random graphs to create on each iteration to get an average of results.
+        engine (str): max_clique engine to measure.
+        workers (int): Number of processes to solve the samples with, they are solved in this process when None.
+        seed: Seed of the random graphs, fresh entropy is used when None.
     """
     
     assert (0<=beg and 1<=end and beg<end),"invalid beg/end"
-    assert (sample_size>=0),"invalid sample_size"
-    x=[]
-    sol_config_ratio=[]
+    assert (sample_size>=1),"invalid sample_size"
+    x=list(range(beg,end+1))
+    max_edges=(beg*(beg-1))//2
+    rng=np.random.default_rng(seed)
     graphs=[]
-    max_edges=(beg*(beg-1))/2
     for i in range(sample_size):
         if max_edges>0:
-            graphs.append(random_graph(beg,random.randrange(max_edges)))
+            graphs.append(random_graph(beg,int(rng.integers(max_edges)),seed=rng))
         else:
             graphs.append(graph(beg,[]))
-    for n in range(beg,end+1):
-        mean=0
-        for i in range(sample_size):
-            results = list(max_clique(graphs[i]))
-            mean+=len(results[0])/results[2]
-            graphs[i].add_node()
-
-        mean=mean/sample_size
-        x.append(n)
+    specs=[graph(n,g.edges) for n in x for g in graphs]
+    ratios={n:[] for n in x}
+    for result in run_batch(specs,engine,workers,seed):
+        ratios[result["n"]].append(result["sols"]/result["configs"])
+    sol_config_ratio=[]
+    interval=[]
+    for n in x:
+        mean,half=mean_confidence(ratios[n])
         sol_config_ratio.append(mean)
+        interval.append(half)
 
-    plt.plot(x,sol_config_ratio)
+    plt.errorbar(x,sol_config_ratio,yerr=interval,capsize=3)
     plt.title("Solutions/Configurations for input size n")
     plt.xlabel("n")
     plt.xticks(x)
@@ -185,7 +1600,50 @@ def sol_config_ratio_increasing_n(beg: int,end: int,sample_size: int)->None:
 
 
 
-def increasing_m(n: int,beg: int,end: int)->None:
+def sweep_m(n: int,beg: int,end: int,seeds: list=(0,))->list:
+    """
+    Solve a graph with n nodes for every number of edges from beg to end, adding one edge at a time.
+    For every seed one random order of all the possible edges is drawn; the graph with its first beg edges is solved,
+    and then the next edges are added one by one with incremental_max_clique, which only searches the cliques
+    through the new edge and uses the current max size as the bar to beat (it can only grow).
+
+    Args:
+        n (int): Number of nodes.
+        beg (int): Number of edges of the first graph.
+        end (int): Number of edges of the last graph.
+        seeds (list): Seeds of the edge orders, one series per seed.
+
+    Returns:
+        list: One dictionary per seed, with the seed and lists indexed like range(beg,end+1) of: the number of edges ("m"),
+        the max clique size ("max"), the number of max cliques ("sols"), and the recursive calls ("ops"),
+        maximal cliques reached ("configs") and time ("time") spent on each graph, the first one being a full solve.
+    """
+    total=n*(n-1)//2
+    assert (n>=1 and 0<=beg<=end<=total),"invalid n/beg/end"
+    series=[]
+    for seed in seeds:
+        first,second=pairs_from_indices(n,np.random.default_rng(seed).permutation(total)[:end])
+        first=first.tolist()
+        second=second.tolist()
+        inc=incremental_max_clique(graph(n,list(zip(first[:beg],second[:beg]))))
+        result={"seed":seed,"m":[],"max":[],"sols":[],"ops":[],"configs":[],"time":[]}
+        ops=configs=0
+        spent=0.0
+        for m in range(beg,end+1):
+            if m>beg:
+                inc.add_edge(first[m-1],second[m-1])
+            sols,n_rec_calls,n_configurations,elapsed=inc.solution()
+            result["m"].append(m)
+            result["max"].append(len(sols[0]) if sols else 0)
+            result["sols"].append(len(sols))
+            result["ops"].append(n_rec_calls-ops)
+            result["configs"].append(n_configurations-configs)
+            result["time"].append(elapsed-spent)
+            ops,configs,spent=n_rec_calls,n_configurations,elapsed
+        series.append(result)
+    return series
+
+def increasing_m(n: int,beg: int,end: int,engine: str="exhaustive",seeds: list=None)->None:
     """
     Comparing the effect adding edges to a graph has on the number of basic operations.
 
@@ -193,42 +1651,99 @@ def increasing_m(n: int,beg: int,end: int)->None:
         n (int): Number of nodes to use on the test graph.
         beg (int): Number of edges to start plotting from. 
         end (int): Number of edges to end plotting at.
+        engine (str): max_clique engine to measure.
+        seeds (list): When given, the graphs grow one edge at a time with sweep_m instead of being drawn again for every
+            number of edges, and the max clique size and operations of every seed are plotted. engine isn't used then.
     """
     assert (n>=0),"invalid n"
     max_edges = (n*(n-1))/2
     assert (0<=beg<=max_edges-1 and 1<=end<=max_edges and beg<end),"invalid beg/end"
+    if seeds is not None:
+        fig,(top,bottom)=plt.subplots(2,1,sharex=True)
+        for result in sweep_m(n,beg,end,seeds):
+            top.plot(result["m"],result["max"],label="seed "+str(result["seed"]))
+            bottom.plot(result["m"],result["ops"],label="seed "+str(result["seed"]))
+        top.set_title("Max clique size and operations for #M edges")
+        top.set_ylabel("max clique size")
+        bottom.set_ylabel("# basic operations")
+        bottom.set_xlabel("m")
+        top.legend(loc="upper left")
+        plt.show()
+        return
     for m in range(beg,end+1):
         g=random_graph(n,m)
-        results = max_clique(g)
+        results = max_clique(g,engine)
         
         print(results[1])
     
 
-n_rec_calls=0
-def rec_maxclique(n_vertices:list,m_edges:list) -> list:
+class rec_stats:
+    """
+    Class that holds the counters of a rec_maxclique run: recursive calls and how the cache of solved subsets behaved.
+    """
+    def __init__(self,cache_size: int):
+        self.cache_size=cache_size
+        self.n_rec_calls=0
+        self.hits=0
+        self.misses=0
+        self.evictions=0
+
+    def __str__(self):
+        return str(self.n_rec_calls) + " recursive calls, cache of " + str(self.cache_size) + ": " + str(self.hits) + " hits, " + str(self.misses) + " misses, " + str(self.evictions) + " evictions"
+
+def rec_maxclique(n_vertices:list,m_edges:list,cache_size: int=DEFAULT_REC_CACHE_SIZE) -> (list,rec_stats):
     """
     Example of the max clique problem solved recursively.
     This function was made out of curiosity, it didn't serve any purpose for the report.
+    A subgraph that isn't a clique has two vertices without an edge between them, and no clique can have both,
+    so its max clique is the largest of the ones without each of the two.
+    Subgraphs are bitmasks of their vertices, and the ones already solved are kept in a LRU cache of at most cache_size entries.
+    Every call has its own cache and counters, so calls can run at the same time.
 
     Args:
         n_vertices (list): List of vertices in current subgraph.
         m_edges (list): List of edges.
+        cache_size (int): Max number of solved subgraphs kept.
 
     Returns:
-        list: A max clique.
-    """
-    global n_rec_calls
-    if not n_vertices:
-        return []
-    for i in n_vertices:
-        for j in n_vertices:
-            if i!=j and not (i,j) in m_edges and not (j,i) in m_edges:
-                values = []
-                for k in n_vertices:
-                    values.append(rec_maxclique(list(set(n_vertices) - set([k])),m_edges))
-                    n_rec_calls+=1   
-                return max(values,key=len)
-    return n_vertices            
+        list,rec_stats: A max clique, counters of the run.
+    """
+    assert (cache_size>=0),"invalid cache size"
+    adj={v:0 for v in n_vertices}
+    for i,j in m_edges:
+        if i in adj and j in adj:
+            adj[i]|=1<<j
+            adj[j]|=1<<i
+    cache=OrderedDict()
+    stats=rec_stats(cache_size)
+
+    def solve(mask: int)->int:
+        stats.n_rec_calls+=1
+        if mask in cache:
+            stats.hits+=1
+            cache.move_to_end(mask)
+            return cache[mask]
+        stats.misses+=1
+        result=mask
+        for i in _bits(mask):
+            missing=mask&~adj[i]&~(1<<i)
+            if missing:
+                j=(missing&-missing).bit_length()-1
+                without_i=solve(mask&~(1<<i))
+                without_j=solve(mask&~(1<<j))
+                result=without_i if _popcount(without_i)>=_popcount(without_j) else without_j
+                break
+        if cache_size>0:
+            cache[mask]=result
+            if len(cache)>cache_size:
+                cache.popitem(last=False)
+                stats.evictions+=1
+        return result
+
+    full=0
+    for v in adj:
+        full|=1<<v
+    return list(_bits(solve(full))),stats
 
 """
 ##graph creation
@@ -236,21 +1751,66 @@ def rec_maxclique(n_vertices:list,m_edges:list) -> list:
 g1=graph(3,[(1,2),(2,3)])
 ##example of randomly generated graph
 g2 = random_graph(10,45)
+##the same random graph can be generated again by giving it a seed
+g3 = random_graph(10,20,seed=42)
 ##printing the graph
 print(g1)
 print(g2)
 ##getting solution to max clique problem
 sol=max_clique(g2)
+##solving it with Bron-Kerbosch instead of the exhaustive search
+sol=max_clique(g2,"bk")
+##or with branch and bound, which only returns one of the max cliques
+sol=max_clique(g2,"bnb")
+##or look for a large clique for one second, and use it as the starting point of branch and bound
+sol=max_clique(g2,"anytime",time_budget=1,callback=lambda clique,ops,t:print(len(clique),ops,t))
+sol=max_clique(g2,"bnb",initial=sol[0][0])
+##or by splitting the vertices in two halves, good for dense graphs of up to about 50 vertices
+sol=max_clique(random_graph_p(40,0.9),"mitm")
+##or without counting basic operations and configurations, when only the cliques are needed
+sol=max_clique(g2,instrument=False)
+##or counting them by subset size too
+c=counters()
+sol=max_clique(g2,instrument=c)
+print(c)
+##or saving the exhaustive search to a file every minute, running it again with the same file resumes it
+sol=max_clique(g2,checkpoint="g2.json")
+##or splitting it in parts that can run on different machines, and putting the parts together
+for i,part in enumerate(split_ranks(g2.n_vertices,4)):
+    max_clique(g2,checkpoint="g2_"+str(i)+".json",rank_range=part)
+sol=merge_checkpoints(["g2_"+str(i)+".json" for i in range(4)])
+##or with the exhaustive search split over 4 processes
+sol=max_clique(g2,workers=4)
+##removing the vertices that can't be in a max clique before searching
+sol=max_clique(g2,"bk",reduce=True)
+##only counting the max cliques, or going through them one at a time
+count=max_clique(g2,mode="count")[0]
+for clique in max_clique(g2,mode="iter"):
+    print(clique)
 ##printing solution
 print(sol)
+##keeping the solution up to date while the graph grows
+inc=incremental_max_clique(g1)
+inc.add_node()
+inc.add_edge(3,4)
+print(inc.solution())
 """
 """
 ##checking for impact of the number of edges on basic operations
 increasing_m(10,1,20)
+##the same growing 3 graphs one edge at a time
+increasing_m(10,1,45,seeds=[0,1,2])
 ##example of plotting the impact of #n's growth on amount of basic operations
 basic_op_increasing_n(1,20)
+##the same plot for the Bron-Kerbosch engine
+basic_op_increasing_n(1,20,"bk")
 ##example of plotting the impact of #n's growth on running time
 exec_time_increasing_n(1,20)
 ##example of plotting the impact of #n's growth on the ratio of solutions/configs
 sol_config_ratio_increasing_n(1,15,5)
+##the same with 50 samples solved in 4 processes
+sol_config_ratio_increasing_n(1,15,50,workers=4)
+##solving a batch of seeded random graphs in 4 processes, as they finish
+for result in run_batch([("gnm",12,40)]*20,"bk",workers=4,seed=1):
+    print(result)
 """
\ No newline at end of file
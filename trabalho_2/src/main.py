@@ -2,6 +2,7 @@ import random
 from math import sqrt,pow,ceil,log
 import sys
 from tabulate import tabulate
+import numpy as np
 import matplotlib.pyplot as plt
 
 #Global variables
@@ -13,26 +14,62 @@ DEFAULT_FPC_P=0.5
 DEFAULT_LDPC_BASE=2**(1/2)
 DEFAULT_N_SIMULATIONS=20
 DEFAULT_SIMULATION_STRING_SIZES=[100,500,1000,5000,10000,50000,100000,500000,1000000]
+DEFAULT_TEST_CHAIN_WEIGHTS=None
+DEFAULT_FPC_ENGINE="binomial"
+DEFAULT_BLOCK_SIZE=2**16
+DEFAULT_CHUNK_SIZE=2**22
+DEFAULT_LDPC_ENGINE="skip"
+FPC_ENGINES=["loop","binomial","stream"]
+LDPC_ENGINES=["loop","skip","stream"]
+TABLE_HEADER=['Char','Counter Value','Estimated Value','Real Value','Estimated Rank','Real Rank','Accuracy Ratio','Absolute Error','Relative Error']
+rng=np.random.default_rng()
 
 class char_chain:
     """
     Class that represents the test chains of characters. 
     Contains attributes such as the source string, size, the generated chain and exact counters.
+    The chain is kept as one byte per character: codes (np.uint8) holds the position of every character in symbols,
+    the distinct characters of the source string in order of appearance. chain decodes it into a string the first time it is used.
+    Each character of the source string is picked with chance proportional to its weight (1 by default, so repeated
+    characters are more likely), drawn in chunks of chunk_size characters.
     """
-    def __init__(self,source_string,chain_size):
+    def __init__(self,source_string,chain_size,weights=None,chunk_size=DEFAULT_CHUNK_SIZE):
+        assert (len(source_string)>0 and chain_size>=0),"invalid source string or chain size"
         self.source_string=source_string
         self.chain_size=chain_size
-        self.chain=""
-        self.exact_count={}
-        for _ in range(chain_size):
-            nextChar = random.choice(source_string)
-            self.chain += nextChar
-            if not nextChar in self.exact_count:
-                self.exact_count[nextChar]=0
-            self.exact_count[nextChar] = self.exact_count[nextChar]+1
+        self.symbols="".join(dict.fromkeys(source_string))
+        assert (len(self.symbols)<=256),"at most 256 different characters"
+        if weights is None:
+            weights=np.ones(len(source_string))
+        weights=np.asarray(weights,dtype=np.float64)
+        assert (weights.shape==(len(source_string),) and (weights>=0).all() and weights.sum()>0),"invalid weights"
+        symbol_weights=np.zeros(len(self.symbols))
+        np.add.at(symbol_weights,[self.symbols.index(c) for c in source_string],weights)
+        self.weights=symbol_weights/symbol_weights.sum()
+
+        self.codes=np.empty(chain_size,dtype=np.uint8)
+        counts=np.zeros(len(self.symbols),dtype=np.int64)
+        first=np.full(len(self.symbols),-1,dtype=np.int64)
+        for i in range(0,chain_size,chunk_size):
+            chunk=rng.choice(len(self.symbols),size=min(chunk_size,chain_size-i),p=self.weights).astype(np.uint8)
+            self.codes[i:i+len(chunk)]=chunk
+            chunk_counts=np.bincount(chunk,minlength=len(self.symbols))
+            for j in np.flatnonzero((chunk_counts>0)&(first<0)).tolist():
+                first[j]=i+int(np.argmax(chunk==j))
+            counts+=chunk_counts
+        self._chain=None
+        ##characters in order of first occurrence in the chain
+        self.exact_count={self.symbols[j]:int(counts[j]) for j in sorted(np.flatnonzero(first>=0).tolist(),key=lambda j:first[j])}
         self.order = sorted(self.exact_count.items(), key=lambda x: x[1], reverse=True)
         self.ranks = self.get_ranks()
 
+    @property
+    def chain(self):
+        if self._chain is None:
+            table=np.array([ord(c) for c in self.symbols],dtype=np.uint32)
+            self._chain=table[self.codes].tobytes().decode("utf-32-le")
+        return self._chain
+
     def get_ranks(self):
         ranks = {}
         n=1
@@ -51,10 +88,16 @@ class prob_counter:
     """
     Class that represents a fixed chance probabilistic counter's application on a certain test chain.
     Contains attributes such as the test chain, the chance, the calculated occurrences, estimated occurrences, errors, etc. 
+    The counters can be computed by one of the FPC_ENGINES:
+    "loop" draws a chance for every character of the chain,
+    "binomial" draws every final counter at once, since a counter incremented with chance p on each of its c occurrences is Binomial(c,p),
+    "stream" goes through the chain in blocks of numpy draws, in the order of the events.
     """
-    def __init__(self, char_chain, p):    
+    def __init__(self, char_chain, p, engine=DEFAULT_FPC_ENGINE):    
+        assert (engine in FPC_ENGINES),"invalid engine"
         self.char_chain = char_chain
         self.p=p
+        self.engine=engine
         self.dict = {} ##the counters
         self.count()
         self.estimated_values = self.get_estimated_values()
@@ -62,7 +105,6 @@ class prob_counter:
         self.absolute_errors = stats[0] 
         self.relative_errors = stats[1]
         self.accuracy_ratios = stats[2]
-        tableHeader = ['Char','Counter Value','Estimated Value','Real Value','Estimated Rank','Real Rank','Accuracy Ratio','Absolute Error','Relative Error']
         tableArray=[]
         self.order = sorted(self.dict.items(), key=lambda x: x[1], reverse=True)
         n=1
@@ -70,10 +112,14 @@ class prob_counter:
             row = [i,self.dict[i],self.estimated_values[i],self.char_chain.exact_count[i],n,self.char_chain.ranks[i],str(self.accuracy_ratios[i]*100) + "%",self.absolute_errors[i],str(self.relative_errors[i]*100) + "%" ]
             tableArray.append(row)
             n+=1
-        self.table = tabulate(tableArray,headers=tableHeader)
+        self.table = tabulate(tableArray,headers=TABLE_HEADER)
         
      
     def  count(self):
+        if self.engine=="binomial":
+            return self.count_binomial()
+        if self.engine=="stream":
+            return self.count_stream()
         for c in self.char_chain.chain:
             if not c in self.dict:
                 self.dict[c]=0
@@ -82,6 +128,24 @@ class prob_counter:
             if to_add:
                 self.dict[c] = self.dict[c] + 1
         return self.dict
+
+    def count_binomial(self):
+        ##exact_count keeps the characters in order of first occurrence, like the loop fills the counters
+        chars=list(self.char_chain.exact_count)
+        values=rng.binomial(list(self.char_chain.exact_count.values()),self.p)
+        self.dict=dict(zip(chars,values.tolist()))
+        return self.dict
+
+    def count_stream(self,block_size=DEFAULT_BLOCK_SIZE):
+        self.dict={c:0 for c in self.char_chain.exact_count}
+        codes=self.char_chain.codes
+        symbols=self.char_chain.symbols
+        for i in range(0,len(codes),block_size):
+            block=codes[i:i+block_size]
+            hits=np.bincount(block[rng.random(len(block))<self.p],minlength=len(symbols))
+            for j in np.flatnonzero(hits).tolist():
+                self.dict[symbols[j]]+=int(hits[j])
+        return self.dict
     
    
             
@@ -119,18 +183,57 @@ class prob_counter:
 
 
     def __str__(self):
-        text = "Fixed probabilistic counter with chance: " + str(self.p*100) + "%\n" +self.table +"\n"
+        text = counter_title(FPC,self.p) +self.table +"\n"
         return text
 
 
+class ldpc_stream:
+    """
+    Class that holds logarithmic decreasing chance probabilistic counters fed by an interleaved stream of characters.
+    Besides the counter of each character it keeps how many more occurrences it takes until its next increment:
+    with a counter c that number follows a geometric distribution of chance 1/base^c, so it is drawn once per increment
+    and occurrences are skipped in bulk, costing O(final counter) draws per character instead of one per occurrence.
+    """
+    def __init__(self,base):
+        self.base=base
+        self.counters={}
+        self.remaining={}
+
+    def add(self,c,occurrences):
+        counter=self.counters.get(c,0)
+        remaining=self.remaining.get(c,1)
+        while occurrences>=remaining:
+            occurrences-=remaining
+            counter+=1
+            remaining=int(rng.geometric(min(1,1/pow(self.base,counter))))
+        self.counters[c]=counter
+        self.remaining[c]=remaining-occurrences
+
+    def update(self,block):
+        codes=np.frombuffer(block.encode("utf-32-le"),dtype=np.uint32)
+        chars,occurrences=np.unique(codes,return_counts=True)
+        for code,n in zip(chars.tolist(),occurrences.tolist()):
+            self.add(chr(code),n)
+
+    def update_codes(self,codes,symbols):
+        occurrences=np.bincount(codes,minlength=len(symbols))
+        for j in np.flatnonzero(occurrences).tolist():
+            self.add(symbols[j],int(occurrences[j]))
+
 class dec_prob_counter:
     """
     Class that represents a logarithmic decreasing chance probabilistic counter's application on a certain test chain.
     Contains attributes such as the test chain, the base, the calculated occurrences, estimated occurrences, errors, etc. 
+    The counters can be computed by one of the LDPC_ENGINES:
+    "loop" draws a chance for every character of the chain,
+    "skip" jumps from increment to increment of each character with ldpc_stream, using the exact counts,
+    "stream" feeds the chain to an ldpc_stream in blocks, in the order of the events.
     """
-    def __init__(self, char_chain,base):    
+    def __init__(self, char_chain,base, engine=DEFAULT_LDPC_ENGINE):    
+        assert (engine in LDPC_ENGINES),"invalid engine"
         self.char_chain = char_chain
         self.base=base
+        self.engine=engine
         self.dict = {} ##the counters
         self.count()
         self.estimated_values = self.get_estimated_values()
@@ -138,7 +241,6 @@ class dec_prob_counter:
         self.absolute_errors = stats[0] 
         self.relative_errors = stats[1]
         self.accuracy_ratios = stats[2]
-        tableHeader = ['Char','Counter Value','Estimated Value','Real Value','Estimated Rank','Real Rank','Accuracy Ratio','Absolute Error','Relative Error']
         tableArray=[]
         self.order = sorted(self.dict.items(), key=lambda x: x[1], reverse=True)
         n=1
@@ -146,11 +248,23 @@ class dec_prob_counter:
             row = [i,self.dict[i],self.estimated_values[i],self.char_chain.exact_count[i],n,self.char_chain.ranks[i],str(self.accuracy_ratios[i]*100) + "%",self.absolute_errors[i],str(self.relative_errors[i]*100) + "%" ]
             tableArray.append(row)
             n+=1
-        self.table = tabulate(tableArray,headers=tableHeader)
+        self.table = tabulate(tableArray,headers=TABLE_HEADER)
         
        
    
     def  count(self):
+        if self.engine!="loop":
+            stream=ldpc_stream(self.base)
+            stream.counters={c:0 for c in self.char_chain.exact_count}
+            if self.engine=="skip":
+                for c,occurrences in self.char_chain.exact_count.items():
+                    stream.add(c,occurrences)
+            else:
+                codes=self.char_chain.codes
+                for i in range(0,len(codes),DEFAULT_BLOCK_SIZE):
+                    stream.update_codes(codes[i:i+DEFAULT_BLOCK_SIZE],self.char_chain.symbols)
+            self.dict=stream.counters
+            return self.dict
         chances={}
         for c in self.char_chain.chain:
             if not c in self.dict:
@@ -218,13 +332,66 @@ class dec_prob_counter:
 
 
     def __str__(self):
-        text = "Logarithmic decreasing probability counter with base: " + str(self.base) + "\n" + self.table + "\n"
+        text = counter_title(LDPC,self.base) + self.table + "\n"
         return text
 
 
-def simulate(path: str,test_chain: char_chain,n_simulations: int,counter_type: int,aux: float)->(dict,dict,dict,dict,dict):
+def counter_title(counter_type: int,aux: float)->str:
+    """
+    Title line of the table of a counter (FPC or LDPC) with chance or base aux.
+    """
+    if counter_type==FPC:
+        return "Fixed probabilistic counter with chance: " + str(aux*100) + "%\n"
+    return "Logarithmic decreasing probability counter with base: " + str(aux) + "\n"
+
+def counter_matrix(test_chain: char_chain,n_simulations: int,counter_type: int,aux: float,engine: str)->np.ndarray:
+    """
+    Run n_simulations counters (FPC or LDPC) on a test chain at once.
+    With the "binomial" FPC engine every counter is drawn in one numpy call, and with the "skip" LDPC engine all the counters
+    go up one level at a time: the occurrences until the next increment of every counter still running are drawn together
+    from a geometric distribution, and the counters whose occurrences run out stop. Other engines run one counter object per simulation.
+
+    Args:
+        test_chain (char_chain): chain of characters to be tested.
+        n_simulations (int): number of simulations to run.
+        counter_type (int): type of counter to run (FPC or LDPC)
+        aux (float): p chance in the case of FPC or base in the case of LDPC
+        engine (str): engine of the counters, one of FPC_ENGINES or LDPC_ENGINES
+
+    Returns:
+        np.ndarray: (n_simulations x characters) counters, the characters in the order of test_chain.exact_count.
+    """
+    exact=np.array(list(test_chain.exact_count.values()),dtype=np.int64)
+    if counter_type==FPC and engine=="binomial":
+        return rng.binomial(exact,aux,size=(n_simulations,len(exact)))
+    if counter_type==LDPC and engine=="skip":
+        counters=np.zeros((n_simulations,len(exact)),dtype=np.int64)
+        remaining=np.repeat(exact[None,:],n_simulations,axis=0)
+        flat_counters=counters.reshape(-1)
+        flat_remaining=remaining.reshape(-1)
+        running=np.flatnonzero(flat_remaining>0)
+        level=0
+        while running.size:
+            gaps=rng.geometric(min(1,1/pow(aux,level)),size=running.size)
+            hit=gaps<=flat_remaining[running]
+            running=running[hit]
+            flat_remaining[running]-=gaps[hit]
+            flat_counters[running]+=1
+            level+=1
+        return counters
+    rows=[]
+    for _ in range(n_simulations):
+        if counter_type==FPC:
+            counter=prob_counter(test_chain,aux,engine)
+        else:
+            counter=dec_prob_counter(test_chain,aux,engine)
+        rows.append([counter.dict[c] for c in test_chain.exact_count])
+    return np.array(rows,dtype=np.int64).reshape(n_simulations,len(exact))
+
+def simulate(path: str,test_chain: char_chain,n_simulations: int,counter_type: int,aux: float,fpc_engine: str=DEFAULT_FPC_ENGINE,ldpc_engine: str=DEFAULT_LDPC_ENGINE)->(dict,dict,dict,dict,dict):
     """
     Method to run multiple simulations of probabilistic counters (FPC or LDPC) on a test chain of characters, and collect stats.
+    The counters of every simulation are computed at once with counter_matrix, and the stats with array operations over its rows.
     Also creates 2 files, one containing all the counters simulated and another with an overview of the stats collected across all counters simulated.
 
     Args:
@@ -233,83 +400,91 @@ def simulate(path: str,test_chain: char_chain,n_simulations: int,counter_type: i
         n_simulations (int): number of simulations to run.
         counter_type (int): type of counter to run (FPC or LDPC)
         aux (float): p chance in the case of FPC or base in the case of LDPC
+        fpc_engine (str): engine used by the FPC counters, one of FPC_ENGINES
+        ldpc_engine (str): engine used by the LDPC counters, one of LDPC_ENGINES
 
     Returns:
         dict,dict,dict,dict,dict: dictionaries containing data on mean: absolute error, accuracy ratio, counters, relative errors and rankings.
     """
+    chars=list(test_chain.exact_count)
+    exact=np.array(list(test_chain.exact_count.values()),dtype=np.int64)
+    counters=counter_matrix(test_chain,n_simulations,counter_type,aux,fpc_engine if counter_type==FPC else ldpc_engine)
+    if counter_type==FPC:
+        estimates=counters*(1/aux)
+    else:
+        estimates=np.array([round((pow(aux,c)-aux+1)/(aux-1)) for c in range(int(counters.max())+1)],dtype=np.int64)[counters]
+    abs_errors=np.abs(exact-estimates)
+    rel_errors=abs_errors/exact
+    acc_ratios=estimates/exact
+    ##estimated ranks, ties keep the order of first occurrence like sorting the counters of each simulation
+    order=np.argsort(-counters,axis=1,kind="stable")
+    ranks=np.empty_like(order)
+    np.put_along_axis(ranks,order,np.arange(1,len(chars)+1)[None,:],axis=1)
+
     with open("../testdata/simulations/" + path + ".txt","w",encoding="utf-8") as f:
         
-        all_rel_error={}
-        all_acc_ratio={}
-        all_abs_error={}
-        all_ranks={}
-        all_counters={}
-        
         if counter_type==FPC:          
             f.write("simulating fixed probability counter with p=" + str(aux) + " " + str(n_simulations)  + " times" +" for test chain of size " + str(test_chain.chain_size)+"\n" )
         elif counter_type==LDPC:
             f.write("simulating logarithmic decreasing probability counter with base=" + str(aux) + " " + str(n_simulations)  + " times"+" for test chain of size " + str(test_chain.chain_size)+"\n" )
         f.write(test_chain.__str__() + "\n")
 
+        title=counter_title(counter_type,aux)
+        real_ranks=[test_chain.ranks[c] for c in chars]
+        exact_list=exact.tolist()
         for i in range(n_simulations):
-            if counter_type==FPC:
-                counter = prob_counter(test_chain,aux)
-            elif counter_type==LDPC:
-                counter = dec_prob_counter(test_chain,aux)
-            n=1
-            for c,cval in counter.order:
-                
-               
-                if not c in all_counters:
-                    all_counters[c]=[]
-                    all_abs_error[c]=[]
-                    all_rel_error[c]=[]
-                    all_acc_ratio[c]=[]
-                    all_ranks[c]=[]
-                all_counters[c].append(cval)                        
-                all_acc_ratio[c].append(counter.accuracy_ratios[c]*100)
-                all_abs_error[c].append(counter.absolute_errors[c])
-                all_rel_error[c].append(counter.relative_errors[c]*100)
-                all_ranks[c].append(n)
-                n+=1 
+            row_counters=counters[i].tolist()
+            row_estimates=estimates[i].tolist()
+            row_acc=acc_ratios[i].tolist()
+            row_abs=abs_errors[i].tolist()
+            row_rel=rel_errors[i].tolist()
+            table_arr=[]
+            for n,j in enumerate(order[i].tolist(),1):
+                table_arr.append([chars[j],row_counters[j],row_estimates[j],exact_list[j],n,real_ranks[j],str(row_acc[j]*100) + "%",row_abs[j],str(row_rel[j]*100) + "%"])
             f.write("######################## Simulation nr " + str(i+1)+ " ########################\n")
-            f.write(counter.__str__())
+            f.write(title + tabulate(table_arr,headers=TABLE_HEADER) + "\n")
             f.write("\n\n")
         
-        max_counters =  {p[0]:int(max(p[1])) for p in all_counters.items()}
-        min_counters =  {p[0]:int(min(p[1])) for p in all_counters.items()}  
-        mean_counters = {p[0]:int(round(sum(p[1])/n_simulations)) for p in all_counters.items()}
+        ##characters in the order of the first simulation, like the counters were first met
+        keys=order[0].tolist()
+        def per_char(values):
+            values=values.tolist()
+            return [(chars[j],values[j]) for j in keys]
+
+        max_counters =  {c:int(v) for c,v in per_char(counters.max(axis=0))}
+        min_counters =  {c:int(v) for c,v in per_char(counters.min(axis=0))}
+        mean_counters = {c:int(round(v/n_simulations)) for c,v in per_char(counters.sum(axis=0))}
 
         if counter_type==0:
-            max_values = {p[0]:int((round(max(p[1]))*1/aux)) for p in all_counters.items()}
-            min_values = {p[0]:int((round(min(p[1]))*1/aux)) for p in all_counters.items()}
-            mean_values = {p[0]:int(round(p[1])*1/aux) for p in mean_counters.items()}
+            max_values = {c:int((round(v)*1/aux)) for c,v in max_counters.items()}
+            min_values = {c:int((round(v)*1/aux)) for c,v in min_counters.items()}
+            mean_values = {c:int(round(v)*1/aux) for c,v in mean_counters.items()}
         elif counter_type==1:
-            max_values = {p[0]:int(round((pow(aux,max(p[1]))-aux+1)/(aux-1))) for p in all_counters.items()}
-            min_values = {p[0]:int(round((pow(aux,min(p[1]))-aux+1)/(aux-1))) for p in all_counters.items()}
-            mean_values = {p[0]:int(round((pow(aux,p[1])-aux+1)/(aux-1))) for p in mean_counters.items()}
+            max_values = {c:int(round((pow(aux,v)-aux+1)/(aux-1))) for c,v in max_counters.items()}
+            min_values = {c:int(round((pow(aux,v)-aux+1)/(aux-1))) for c,v in min_counters.items()}
+            mean_values = {c:int(round((pow(aux,v)-aux+1)/(aux-1))) for c,v in mean_counters.items()}
 
         
-        max_abs_error={p[0]:int(max(p[1])) for p in all_abs_error.items()}
-        min_abs_error={p[0]:int(min(p[1])) for p in all_abs_error.items()}           
-        mean_abs_error = {p[0]:int(round(sum(p[1])/n_simulations)) for p in all_abs_error.items()}   
-
-        max_rel_error={p[0]:max(p[1]) for p in all_rel_error.items()}
-        min_rel_error={p[0]:min(p[1]) for p in all_rel_error.items()} 
-        mean_rel_error = {p[0]:(sum(p[1])/n_simulations) for p in all_rel_error.items()}           
+        max_abs_error={c:int(v) for c,v in per_char(abs_errors.max(axis=0))}
+        min_abs_error={c:int(v) for c,v in per_char(abs_errors.min(axis=0))}
+        mean_abs_error = {c:int(round(v/n_simulations)) for c,v in per_char(abs_errors.sum(axis=0))}
+
+        rel_percent=rel_errors*100
+        max_rel_error={c:v for c,v in per_char(rel_percent.max(axis=0))}
+        min_rel_error={c:v for c,v in per_char(rel_percent.min(axis=0))}
+        mean_rel_error = {c:v/n_simulations for c,v in per_char(rel_percent.sum(axis=0))}
         
-        max_ranks = {p[0]:int(max(p[1])) for p in all_ranks.items()}
-        min_ranks = {p[0]:int(min(p[1])) for p in all_ranks.items()}
-        mean_ranks = {p[0]:int(round(sum(p[1])/n_simulations)) for p in all_ranks.items()}
+        max_ranks = {c:int(v) for c,v in per_char(ranks.max(axis=0))}
+        min_ranks = {c:int(v) for c,v in per_char(ranks.min(axis=0))}
+        mean_ranks = {c:int(round(v/n_simulations)) for c,v in per_char(ranks.sum(axis=0))}
         
-        max_acc_ratio ={p[0]:max(p[1]) for p in all_acc_ratio.items()}
-        min_acc_ratio ={p[0]:min(p[1]) for p in all_acc_ratio.items()} 
-        mean_acc_ratio={p[0]:sum(p[1])/n_simulations for p in all_acc_ratio.items()}
+        acc_percent=acc_ratios*100
+        max_acc_ratio ={c:v for c,v in per_char(acc_percent.max(axis=0))}
+        min_acc_ratio ={c:v for c,v in per_char(acc_percent.min(axis=0))}
+        mean_acc_ratio={c:v/n_simulations for c,v in per_char(acc_percent.sum(axis=0))}
         
             
             
-        tableHeader = ['Char','Counter Value','Estimated Value','Real Value','Estimated Rank','Real Rank','Accuracy Ratio','Absolute Error','Relative Error']
-        
         ordered_avg_values=sorted(mean_values.items(), key=lambda x: x[1], reverse=True)
         table_arr=[]
         for t,_ in ordered_avg_values:
@@ -329,7 +504,7 @@ def simulate(path: str,test_chain: char_chain,n_simulations: int,counter_type: i
         elif counter_type==LDPC:
             f2.write("simulating logarithmic decreasing probability counter with base=" + str(aux) + " " + str(n_simulations)  + " times"+" for test chain of size " + str(test_chain.chain_size)+"\n" )
         f2.write("######################## Stats across all simulations ########################\n")
-        f2.write(tabulate(table_arr,headers=tableHeader))
+        f2.write(tabulate(table_arr,headers=TABLE_HEADER))
         f2.write("\nMin/Mean/Max")
        
         
@@ -479,6 +654,22 @@ if __name__ == "__main__":
                 else:
                     print("Invalid base for LDPC, must be number bigger than 0 and not 1")
                     sys.exit()
+            elif args[i - 1] == "-fpc_engine":
+                if args[i] in FPC_ENGINES:
+
+                    DEFAULT_FPC_ENGINE=args[i]
+
+                else:
+                    print("Invalid engine for FPC, must be one of " + ", ".join(FPC_ENGINES))
+                    sys.exit()
+            elif args[i - 1] == "-ldpc_engine":
+                if args[i] in LDPC_ENGINES:
+
+                    DEFAULT_LDPC_ENGINE=args[i]
+
+                else:
+                    print("Invalid engine for LDPC, must be one of " + ", ".join(LDPC_ENGINES))
+                    sys.exit()
             elif args[i - 1] == "-test_chain":
                 src_string = str(args[i])
 
@@ -489,6 +680,17 @@ if __name__ == "__main__":
                 else:
                     print("Invalid source string for test chain, must have length bigger than 0")
                     sys.exit()
+            elif args[i - 1] == "-weights":
+                
+                weights = eval(args[i],{"__builtins__":None})
+
+                if isinstance(weights,list) and all(isinstance(item,(int,float)) and item>=0 for item in weights) and sum(weights)>0:
+
+                    DEFAULT_TEST_CHAIN_WEIGHTS=weights
+
+                else:
+                    print("Invalid weights list")
+                    sys.exit()
             elif args[i - 1] == "-chain_sizes":
                 
                 chain_sizes = eval(args[i],{"__builtins__":None})
@@ -510,9 +712,12 @@ if __name__ == "__main__":
               "\n\nParameters:\n"
               "-nsims: integer larger than 0 to denote the number of times each counter will be simulated for each test chain (default = 20)\n"
               "-test_chain: string from which the test chains will be built (default = \"rodrigomiguelmaiaferreirarrrrrrrrrroooooo\" )\n"
+              "-weights: list with one weight (number not smaller than 0) per character of the test_chain string, the chance of each character being picked (default = 1 for every character)\n"
               "-chain_sizes: list containing the various chain sizes to be simulated (default = [100,500,1000,5000,10000,50000,100000,500000,1000000])\n"
               "-fpc: float larger than 0 which will be used as the probability in the FPC (default = 0.5)\n"
+              "-fpc_engine: how the FPC counters are computed, loop (one draw per character), binomial (one draw per character type) or stream (blocks of draws in chain order) (default = binomial)\n"
               "-ldpc: string expression (accepts sqrt(n) and log(n) besides the basic expressions) to represent the base for the LDPC which must be larger than 0 (default = 2**1/2) \n"
+              "-ldpc_engine: how the LDPC counters are computed, loop (one draw per character), skip (one draw per increment) or stream (blocks of the chain, one draw per increment) (default = skip)\n"
               "\n"
               "There is also a special parameter that allows the user to run his own code, after inserted in the denoted section in the bottom of the program:\n"
               "\n-f: executes the code inserted by the user in the free_mode section of the program (just -h, no argument needed)\n"
@@ -544,9 +749,9 @@ if __name__ == "__main__":
         counters[LDPC]={}
         counters[EXACT]={}
         for i in DEFAULT_SIMULATION_STRING_SIZES:
-            test_chain = char_chain(DEFAULT_TEST_CHAIN_STRING,i)
-            resfpc=simulate("fpc"+str(i),test_chain,DEFAULT_N_SIMULATIONS,FPC,DEFAULT_FPC_P)
-            resldpc=simulate("ldpc"+str(i),test_chain,DEFAULT_N_SIMULATIONS,LDPC,DEFAULT_LDPC_BASE)
+            test_chain = char_chain(DEFAULT_TEST_CHAIN_STRING,i,DEFAULT_TEST_CHAIN_WEIGHTS)
+            resfpc=simulate("fpc"+str(i),test_chain,DEFAULT_N_SIMULATIONS,FPC,DEFAULT_FPC_P,DEFAULT_FPC_ENGINE)
+            resldpc=simulate("ldpc"+str(i),test_chain,DEFAULT_N_SIMULATIONS,LDPC,DEFAULT_LDPC_BASE,DEFAULT_FPC_ENGINE,DEFAULT_LDPC_ENGINE)
             rel_err[FPC][i]=resfpc[3]
             rel_err[LDPC][i]=resldpc[3]
             abs_err[FPC][i]=resfpc[0]